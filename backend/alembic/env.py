@@ -14,8 +14,10 @@ sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
 from database import Base
 
 # Import all models to ensure they're included in migrations
-from qsos.models import QSOLogs
+from qsos.models import QSOLogs, SpotterProgress, UploadHash
 from users.models import Users
+from jobs.models import IngestJob
+from profiles.models import RequestProfile
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,72 @@
+"""Add spotter_progress table with per-spotter award progress
+
+Revision ID: 002_spotter_progress
+Revises: 001_initial_schema
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "002_spotter_progress"
+down_revision: Union[str, Sequence[str], None] = "001_initial_schema"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "spotter_progress",
+        sa.Column("spotter", sa.String(), nullable=False),
+        sa.Column(
+            "areas",
+            postgresql.ARRAY(sa.String()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.Column(
+            "regions",
+            postgresql.ARRAY(sa.String()),
+            server_default="{}",
+            nullable=False,
+        ),
+        sa.Column("total_areas", sa.Integer(), server_default="0", nullable=False),
+        sa.Column("total_regions", sa.Integer(), server_default="0", nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["spotter"], ["users.callsign"]),
+        sa.PrimaryKeyConstraint("spotter"),
+    )
+
+    # Backfill from existing QSO logs
+    op.execute(
+        """
+        INSERT INTO spotter_progress
+            (spotter, areas, regions, total_areas, total_regions)
+        SELECT
+            spotter,
+            array_agg(DISTINCT area ORDER BY area),
+            array_agg(DISTINCT right(area, 2) ORDER BY right(area, 2)),
+            count(DISTINCT area),
+            count(DISTINCT right(area, 2))
+        FROM qso_logs
+        WHERE spotter IS NOT NULL AND area IS NOT NULL AND length(area) >= 2
+        GROUP BY spotter
+        """
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table("spotter_progress")
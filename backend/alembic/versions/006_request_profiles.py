@@ -0,0 +1,50 @@
+"""Add request_profiles table for opt-in request profiling
+
+Revision ID: 006_request_profiles
+Revises: 005_upload_hashes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "006_request_profiles"
+down_revision: Union[str, Sequence[str], None] = "005_upload_hashes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "request_profiles",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("method", sa.String(), nullable=False),
+        sa.Column("endpoint", sa.String(), nullable=False),
+        sa.Column("status_code", sa.Integer(), nullable=True),
+        sa.Column("duration", sa.Float(), nullable=False),
+        sa.Column("spotter", sa.String(), nullable=True),
+        sa.Column("record_count", sa.Integer(), nullable=True),
+        sa.Column("summary", sa.Text(), nullable=False),
+        sa.Column("stats", sa.LargeBinary(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=True,
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        op.f("ix_request_profiles_id"), "request_profiles", ["id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_request_profiles_id"), table_name="request_profiles")
+    op.drop_table("request_profiles")
@@ -0,0 +1,30 @@
+"""Add (spotter, id) index on qso_logs for keyset pagination
+
+Revision ID: 007_qso_logs_spotter_id_index
+Revises: 006_request_profiles
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "007_qso_logs_spotter_id_index"
+down_revision: Union[str, Sequence[str], None] = "006_request_profiles"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_qso_logs_spotter_id", "qso_logs", ["spotter", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_qso_logs_spotter_id", table_name="qso_logs")
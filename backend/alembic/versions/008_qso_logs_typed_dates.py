@@ -0,0 +1,105 @@
+"""Add typed QSO date columns to qso_logs and rework its indexes
+
+Revision ID: 008_qso_logs_typed_dates
+Revises: 007_qso_logs_spotter_id_index
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from datetime import date
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "008_qso_logs_typed_dates"
+down_revision: Union[str, Sequence[str], None] = "007_qso_logs_spotter_id_index"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Rows per backfill batch, each committed on its own
+BACKFILL_BATCH_SIZE = 10_000
+
+
+def _parse_qso_date(value: Optional[str]) -> Optional[date]:
+    # Same rules as adif_service._parse_qso_date. Postgres' to_date raises
+    # on out-of-range values, so invalid dates are skipped here instead.
+    if not value or len(value) != 8 or not (value.isascii() and value.isdigit()):
+        return None
+    try:
+        return date(int(value[:4]), int(value[4:6]), int(value[6:]))
+    except ValueError:
+        return None
+
+
+def _backfill_qso_date():
+    """
+    Fill qso_date from the existing YYYYMMDD strings, in id order batches.
+    qso_at stays NULL for existing rows, TIME_ON wasn't stored before.
+    """
+    bind = op.get_bind()
+    last_id = 0
+    while True:
+        rows = bind.execute(
+            sa.text(
+                "SELECT id, date FROM qso_logs WHERE id > :last_id "
+                "ORDER BY id LIMIT :limit"
+            ),
+            {"last_id": last_id, "limit": BACKFILL_BATCH_SIZE},
+        ).all()
+        if not rows:
+            break
+        last_id = rows[-1].id
+
+        parsed = [(row.id, _parse_qso_date(row.date)) for row in rows]
+        parsed = [(qso_id, qso_date) for qso_id, qso_date in parsed if qso_date]
+        if parsed:
+            ids, dates = zip(*parsed)
+            bind.execute(
+                sa.text(
+                    "UPDATE qso_logs SET qso_date = v.qso_date "
+                    "FROM unnest(CAST(:ids AS integer[]), CAST(:dates AS date[])) "
+                    "AS v(id, qso_date) WHERE qso_logs.id = v.id"
+                ),
+                {"ids": list(ids), "dates": list(dates)},
+            )
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("qso_logs", sa.Column("qso_date", sa.Date(), nullable=True))
+    op.add_column(
+        "qso_logs", sa.Column("qso_at", sa.DateTime(timezone=True), nullable=True)
+    )
+
+    # Commit per batch, so the backfill doesn't hold locks on the whole table
+    with op.get_context().autocommit_block():
+        _backfill_qso_date()
+
+    # Redundant: the primary key covers id, and both unique_spotter_area and
+    # ix_qso_logs_spotter_id lead with spotter
+    op.drop_index("ix_qso_logs_id", table_name="qso_logs")
+    op.drop_index("ix_qso_logs_spotter", table_name="qso_logs")
+
+    # Area and dx filters of the (spotter, id) keyset listing
+    op.drop_index("ix_qso_logs_area", table_name="qso_logs")
+    op.drop_index("ix_qso_logs_dx", table_name="qso_logs")
+    op.create_index(
+        "ix_qso_logs_area_spotter_id", "qso_logs", ["area", "spotter", "id"]
+    )
+    op.create_index("ix_qso_logs_dx_spotter_id", "qso_logs", ["dx", "spotter", "id"])
+    op.create_index("ix_qso_logs_qso_date", "qso_logs", ["qso_date"])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_qso_logs_qso_date", table_name="qso_logs")
+    op.drop_index("ix_qso_logs_dx_spotter_id", table_name="qso_logs")
+    op.drop_index("ix_qso_logs_area_spotter_id", table_name="qso_logs")
+    op.create_index("ix_qso_logs_dx", "qso_logs", ["dx"])
+    op.create_index("ix_qso_logs_area", "qso_logs", ["area"])
+    op.create_index("ix_qso_logs_spotter", "qso_logs", ["spotter"])
+    op.create_index("ix_qso_logs_id", "qso_logs", ["id"])
+    op.drop_column("qso_logs", "qso_at")
+    op.drop_column("qso_logs", "qso_date")
@@ -0,0 +1,28 @@
+"""Add host column to ingest_jobs
+
+Revision ID: 009_ingest_jobs_host
+Revises: 008_qso_logs_typed_dates
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "009_ingest_jobs_host"
+down_revision: Union[str, Sequence[str], None] = "008_qso_logs_typed_dates"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("ingest_jobs", sa.Column("host", sa.String(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("ingest_jobs", "host")
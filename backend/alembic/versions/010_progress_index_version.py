@@ -0,0 +1,33 @@
+"""Add area_index_version column to spotter_progress
+
+Revision ID: 010_progress_index_version
+Revises: 009_ingest_jobs_host
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "010_progress_index_version"
+down_revision: Union[str, Sequence[str], None] = "009_ingest_jobs_host"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Left NULL: the bit order existing rows were written with isn't known,
+    # so the app rebuilds them from qso_logs on startup
+    op.add_column(
+        "spotter_progress",
+        sa.Column("area_index_version", sa.String(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("spotter_progress", "area_index_version")
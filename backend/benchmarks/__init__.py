@@ -0,0 +1,15 @@
+"""
+Ingest benchmarks on synthetic ADIF logs.
+
+Run from backend/:
+    python -m benchmarks --records 50000 --allow-reset --output results.json
+The database benchmarks need DATABASE_URL and are skipped with --no-db.
+They delete the benchmark spotter's rows between runs, so they only run
+with --allow-reset; point DATABASE_URL at a disposable database.
+"""
+
+import os
+import sys
+
+# Add src to path so the app modules can be imported
+sys.path.append(os.path.join(os.path.dirname(__file__), "..", "src"))
@@ -0,0 +1,98 @@
+import argparse
+import dataclasses
+import json
+import platform
+import subprocess
+from datetime import datetime, timezone
+from benchmarks.generator import LogSpec
+from benchmarks.suite import run_database, run_parsing, run_startup
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def compare(results: dict, baseline: dict):
+    """Print each benchmark's median against the same one in `baseline`."""
+    print(f"{'benchmark':<22}{'baseline':>12}{'current':>12}{'ratio':>8}")
+    for name, current in results["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            continue
+        ratio = current["median"] / before["median"]
+        print(
+            f"{name:<22}{before['median']:>11.4f}s{current['median']:>11.4f}s"
+            f"{ratio:>7.2f}x"
+        )
+
+
+def main():
+    defaults = LogSpec()
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Benchmark the ADIF ingest path."
+    )
+    parser.add_argument("--records", type=int, default=defaults.records)
+    parser.add_argument("--area-ratio", type=float, default=defaults.area_ratio)
+    parser.add_argument("--comment-noise", type=float, default=defaults.comment_noise)
+    parser.add_argument("--slash-ratio", type=float, default=defaults.slash_ratio)
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--no-db", action="store_true", help="skip the database benchmarks"
+    )
+    parser.add_argument(
+        "--allow-reset",
+        action="store_true",
+        help="allow the database benchmarks to delete the benchmark spotter's rows",
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument("--compare", help="JSON results of a previous run")
+    args = parser.parse_args()
+    if not args.no_db and not args.allow_reset:
+        parser.error(
+            "the database benchmarks reset their spotter's rows in DATABASE_URL; "
+            "pass --allow-reset (on a disposable database) or --no-db"
+        )
+
+    spec = LogSpec(
+        records=args.records,
+        area_ratio=args.area_ratio,
+        comment_noise=args.comment_noise,
+        slash_ratio=args.slash_ratio,
+        seed=args.seed,
+    )
+    results = run_startup(args.repeat)
+    results.update(run_parsing(spec, args.repeat))
+    if not args.no_db:
+        results.update(run_database(spec, args.repeat))
+
+    report = {
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "spec": dataclasses.asdict(spec),
+        "repeat": args.repeat,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            compare(report, json.load(f))
+    else:
+        for name, timing in results.items():
+            print(f"{name:<22}{timing['median']:>11.4f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+import random
+from dataclasses import dataclass
+from progress import AREA_CODES
+
+PREFIXES = ("4X", "4Z", "4X1", "4Z5", "K", "W", "DL", "G", "F", "JA", "VK", "UA")
+SLASH_SUFFIXES = ("/P", "/M", "/QRP", "/MM", "/4X", "/A")
+NOISE_WORDS = (
+    "TNX", "QSO", "73", "GL", "CQ", "5NN", "59", "599", "QRZ", "DX",
+    "PSE", "QSL", "VIA", "BURO", "LOTW", "EQSL", "HW", "CPY", "FB", "OM",
+    "NICE", "SIGS", "WX", "SUNNY", "ANT", "YAGI", "DIPOLE", "100W", "RIG",
+)  # fmt: skip
+MODES = ("SSB", "CW", "FT8", "FM")
+FREQS = ("3.650000", "7.090000", "14.205000", "21.300000", "28.427000")
+
+
+@dataclass(frozen=True)
+class LogSpec:
+    """Shape of a synthetic log, see generate_adif."""
+
+    records: int = 10_000
+    area_ratio: float = 0.5  # Share of QSOs with a valid area in SRX_STRING
+    comment_noise: float = 0.5  # Share of QSOs with a free-text comment
+    slash_ratio: float = 0.1  # Share of callsigns with a /suffix
+    spotter: str = "BENCH0TEST"  # Synthetic, its rows are reset between runs
+    home_area: str = "N05KT"  # Sent in STX_STRING on every QSO
+    seed: int = 1
+
+
+def generate_adif(spec: LogSpec) -> bytes:
+    """
+    Deterministic ADIF log of `spec.records` QSOs made by `spec.spotter`.
+    The same spec always produces the same bytes.
+    """
+    rng = random.Random(spec.seed)
+
+    def callsign() -> str:
+        call = f"{rng.choice(PREFIXES)}{rng.randint(0, 9)}{_letters(rng, 3)}"
+        if rng.random() < spec.slash_ratio:
+            call += rng.choice(SLASH_SUFFIXES)
+        return call
+
+    def spotter() -> str:
+        if rng.random() < spec.slash_ratio:
+            return spec.spotter + rng.choice(SLASH_SUFFIXES)
+        return spec.spotter
+
+    def exchange() -> str:
+        if rng.random() < spec.area_ratio:
+            area = rng.choice(AREA_CODES)
+            # Loggers don't always keep the code in one piece
+            if rng.random() < 0.1:
+                return f"{area[0]}{area[1]}-{area[2]}-{area[3:]}"
+            return area
+        return f"{rng.randint(1, 9999):04d}"
+
+    def comment() -> str:
+        if rng.random() >= spec.comment_noise:
+            return ""
+        words = rng.choices(NOISE_WORDS, k=rng.randint(2, 8))
+        words.append(str(rng.randint(1, 999)))
+        return " ".join(words)
+
+    out = [_field("ADIF_VERS", "3.1"), "\n", _field("PROGRAMID", "bench"), "\n<EOH>\n"]
+    for _ in range(spec.records):
+        fields = {
+            "station_callsign": spotter(),
+            "operator": spotter(),
+            "call": callsign(),
+            "qso_date": f"2025{rng.randint(1, 12):02d}{rng.randint(1, 28):02d}",
+            "time_on": f"{rng.randint(0, 23):02d}{rng.randint(0, 59):02d}00",
+            "freq": rng.choice(FREQS),
+            "mode": rng.choice(MODES),
+            "rst_sent": "59",
+            "rst_rcvd": "59",
+            "stx_string": spec.home_area,
+            "srx_string": exchange(),
+            "comment": comment(),
+        }
+        out.append(" ".join(_field(name, value) for name, value in fields.items()))
+        out.append(" <EOR>\n")
+    return "".join(out).encode()
+
+
+def _field(name: str, value: str) -> str:
+    return f"<{name}:{len(value.encode())}>{value}"
+
+
+def _letters(rng: random.Random, count: int) -> str:
+    return "".join(rng.choices("ABCDEFGHIJKLMNOPQRSTUVWXYZ", k=count))
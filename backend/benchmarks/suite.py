@@ -0,0 +1,148 @@
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Callable, Optional
+from adif_service import AdifService
+from adif_tokenizer import AdifTokenizer, tokenize_adif
+from area_matcher import AREA_MATCHER
+from ingest import INGEST_SEGMENT_SIZE
+from benchmarks.generator import LogSpec, generate_adif
+
+# Clerk user ID of the benchmark user, created with spec.spotter as callsign
+BENCH_CLERK_ID = "benchmark"
+
+
+def measure(
+    fn: Callable[[], object],
+    repeat: int,
+    setup: Optional[Callable[[], None]] = None,
+) -> dict:
+    """Time `repeat` runs of fn, calling `setup` untimed before each one."""
+    times = []
+    for _ in range(repeat):
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {
+        "runs": repeat,
+        "min": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times),
+    }
+
+
+def run_parsing(spec: LogSpec, repeat: int) -> dict:
+    """Benchmarks that only need the generated log."""
+    data = generate_adif(spec)
+    records = tokenize_adif(data)
+    service = AdifService(records, spec.spotter)
+
+    def tokenize_segments():
+        tokenizer = AdifTokenizer()
+        for start in range(0, len(data), INGEST_SEGMENT_SIZE):
+            tokenizer.feed(data[start : start + INGEST_SEGMENT_SIZE])
+
+    def match_areas():
+        AREA_MATCHER._cache.clear()
+        for qso in records:
+            AREA_MATCHER.find_areas(qso.stx_string, qso.srx_string, qso.comment)
+
+    return {
+        "tokenize": measure(lambda: tokenize_adif(data), repeat),
+        "tokenize_segments": measure(tokenize_segments, repeat),
+        "get_areas": measure(lambda: list(map(service._get_areas, records)), repeat),
+        "area_matcher": measure(match_areas, repeat),
+        "get_valid_entries": measure(service.get_valid_entries, repeat),
+        "get_valid_columns": measure(service.get_valid_columns, repeat),
+    }
+
+
+def run_startup(repeat: int) -> dict:
+    """
+    Import time of the app and of an ingest pool worker's module, each in a
+    fresh interpreter (interpreter startup included).
+    """
+    src = os.path.join(os.path.dirname(__file__), "..", "src")
+
+    def importing(module: str):
+        command = [sys.executable, "-c", f"import {module}"]
+        return lambda: subprocess.run(command, cwd=src, check=True, capture_output=True)
+
+    return {
+        "import_main": measure(importing("main"), repeat),
+        "import_ingest": measure(importing("ingest"), repeat),
+    }
+
+
+def run_database(spec: LogSpec, repeat: int) -> dict:
+    """
+    Insert and end-to-end benchmarks against DATABASE_URL. Deletes all rows
+    of spec.spotter before each run.
+    """
+    from sqlalchemy import text
+    from database import SessionLocal
+    from qsos.repository import insert_qso_columns, insert_qsos
+    from qsos.schema import QSO
+    from users.models import Users  # noqa: F401, needed by the QSOLogs mapper
+
+    data = generate_adif(spec)
+    service = AdifService(tokenize_adif(data), spec.spotter)
+    entries = [QSO(**entry) for entry in service.get_valid_entries()]
+    columns = service.get_valid_columns()
+
+    db = SessionLocal()
+
+    def reset():
+        # Start every run from a spotter with nothing worked yet
+        db.execute(
+            text(
+                "INSERT INTO users (clerk_user_id, callsign) "
+                "VALUES (:clerk_id, :spotter) ON CONFLICT (clerk_user_id) "
+                "DO UPDATE SET callsign = EXCLUDED.callsign"
+            ),
+            {"clerk_id": BENCH_CLERK_ID, "spotter": spec.spotter},
+        )
+        for table in ("qso_logs", "spotter_progress", "upload_hashes"):
+            db.execute(
+                text(f"DELETE FROM {table} WHERE spotter = :spotter"),
+                {"spotter": spec.spotter},
+            )
+        db.commit()
+
+    try:
+        return {
+            "insert_qsos": measure(lambda: insert_qsos(db, entries), repeat, reset),
+            "insert_qso_columns": measure(
+                lambda: insert_qso_columns(db, columns), repeat, reset
+            ),
+            "read_file": _measure_read_file(data, repeat, reset),
+        }
+    finally:
+        reset()
+        db.close()
+
+
+def _measure_read_file(data: bytes, repeat: int, reset: Callable[[], None]) -> dict:
+    from fastapi.testclient import TestClient
+    import main
+    import utils
+
+    main.app.dependency_overrides[utils.verify_clerk_session] = lambda: BENCH_CLERK_ID
+    try:
+        with TestClient(main.app) as client:
+
+            def upload():
+                response = client.post(
+                    "/read-file",
+                    params={"mode": "summary"},
+                    files={"file": ("bench.adi", data)},
+                )
+                response.raise_for_status()
+
+            return measure(upload, repeat, reset)
+    finally:
+        main.app.dependency_overrides.pop(utils.verify_clerk_session, None)
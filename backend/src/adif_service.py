@@ -1,41 +1,130 @@
 import re
-from area_grids import AREAS
-from qsos.schema import QSO
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional
+from adif_tokenizer import AdifRecord
+from area_index import AREA_INDEX
+from area_matcher import AREA_MATCHER
+from progress import AREA_BITS
 
+if TYPE_CHECKING:
+    # Annotation only, pydantic is slow to import in ingest pool workers
+    from qsos.schema import QSO
 
-class AdifService:
-    def __init__(self, qsos, spotter_callsign):
-        self.qsos = [self._get_required_fields(self._qso_to_dict(qso)) for qso in qsos]
-        self.spotter_callsign = spotter_callsign
 
-    def _qso_to_dict(self, qso) -> dict:
+@dataclass(slots=True)
+class QSOColumns:
+    """
+    Columnar batch of valid entries for one spotter.
+    Each index across the columns is one (QSO, area) hit. `date` is the raw
+    QSO_DATE, `qso_date`/`qso_at` its parsed ISO values (None if invalid).
+    """
+
+    spotter: str
+    date: list[str] = field(default_factory=list)
+    qso_date: list[Optional[str]] = field(default_factory=list)
+    qso_at: list[Optional[str]] = field(default_factory=list)
+    freq: array = field(default_factory=lambda: array("d"))
+    dx: list[str] = field(default_factory=list)
+    area: list[str] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.area)
+
+    def extend(self, other: "QSOColumns"):
+        self.date.extend(other.date)
+        self.qso_date.extend(other.qso_date)
+        self.qso_at.extend(other.qso_at)
+        self.freq.extend(other.freq)
+        self.dx.extend(other.dx)
+        self.area.extend(other.area)
+
+    def first_per_area(self, known_bits: int = 0) -> "QSOColumns":
         """
-        Convert a QSO object to a dictionary.
+        Collapse to one entry per area (its first occurrence), dropping areas
+        already set in the known_bits bitset (see progress.py).
         """
+        seen = set()
+        indexes = []
+        for i, area in enumerate(self.area):
+            if area in seen:
+                continue
+            seen.add(area)
+            if not known_bits & AREA_BITS.get(area, 0):
+                indexes.append(i)
+
+        return QSOColumns(
+            spotter=self.spotter,
+            date=[self.date[i] for i in indexes],
+            qso_date=[self.qso_date[i] for i in indexes],
+            qso_at=[self.qso_at[i] for i in indexes],
+            freq=array("d", [self.freq[i] for i in indexes]),
+            dx=[self.dx[i] for i in indexes],
+            area=[self.area[i] for i in indexes],
+        )
+
+    def rows(self) -> Iterator[tuple]:
+        """
+        Iterate rows as (date, qso_date, qso_at, freq, spotter, dx, area)
+        tuples, see qsos.repository.QSO_COLUMNS.
+        """
+        spotter = self.spotter
+        for date, qso_date, qso_at, freq, dx, area in zip(
+            self.date, self.qso_date, self.qso_at, self.freq, self.dx, self.area
+        ):
+            yield date, qso_date, qso_at, freq, spotter, dx, area
+
+
+def _parse_freq(value: str) -> float:
+    try:
+        return float(value)
+    except ValueError:
+        return 0.0
+
+
+def _parse_qso_date(value: str) -> Optional[str]:
+    """ISO date of an ADIF date (YYYYMMDD), None if invalid."""
+    if len(value) != 8 or not (value.isascii() and value.isdigit()):
+        return None
+    try:
+        return date(int(value[:4]), int(value[4:6]), int(value[6:])).isoformat()
+    except ValueError:
+        return None
+
+
+def _parse_time_on(value: str) -> Optional[str]:
+    """ISO time of an ADIF time (HHMM or HHMMSS), None if invalid."""
+    if len(value) not in (4, 6) or not (value.isascii() and value.isdigit()):
+        return None
+    hour, minute, second = int(value[:2]), int(value[2:4]), int(value[4:] or 0)
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    return f"{hour:02d}:{minute:02d}:{second:02d}"
 
-        qso_dict = {}
-        pattern = re.compile(r"<([^:>]+):(\d+)>([^<]*)")
-        for match in pattern.finditer(str(qso)):
-            field, length, value = match.groups()
-            qso_dict[field.strip().upper()] = value.strip()
-        return qso_dict
-
-    def _get_required_fields(self, qso_dict: dict) -> dict:
-        required_fields = [
-            "QSO_DATE",
-            "FREQ",
-            "STATION_CALLSIGN",
-            "OPERATOR",
-            "CALL",
-            "STX_STRING",
-            "SRX_STRING",
-            "COMMENT",
-        ]
-        return {field: qso_dict.get(field, "") for field in required_fields}
 
-    def _get_areas(self, qso_dict) -> str:
+def _qso_timestamp(qso_date: Optional[str], time_on: Optional[str]) -> Optional[str]:
+    """ISO timestamp of a QSO, ADIF times being UTC. None without both parts."""
+    if qso_date is None or time_on is None:
+        return None
+    return f"{qso_date}T{time_on}+00:00"
+
+
+def parse_qso_time(qso_date: str, time_on: str) -> tuple[Optional[str], Optional[str]]:
+    """Parsed (date, timestamp) of ADIF QSO_DATE and TIME_ON values."""
+    parsed_date = _parse_qso_date(qso_date)
+    return parsed_date, _qso_timestamp(parsed_date, _parse_time_on(time_on))
+
+
+class AdifService:
+    def __init__(self, qsos: Iterable[AdifRecord], spotter_callsign):
+        self.qsos = list(qsos)
+        self.spotter_callsign = spotter_callsign
+
+    def _get_areas(self, qso: AdifRecord) -> list[str]:
         """
-        Extract the grid square from the QSO dictionary.
+        Extract the grid squares from the QSO record.
+        Reference implementation, get_valid_entries uses AREA_MATCHER instead.
         """
 
         def get_valid_area(value: str) -> str:
@@ -48,15 +137,16 @@ class AdifService:
             for word in value.split():
                 if len(word) == 5:
                     region_key = word[-2:]  # Last 2 characters
-                    if region_key in AREAS and word in AREAS[region_key]:
+                    grids = AREA_INDEX["areas"]
+                    if region_key in grids and word in grids[region_key]:
                         return word
             return ""
 
         areas = []
         possible_areas = {
-            "STX_STRING": re.sub(r"[^A-Z0-9 ]", "", qso_dict.get("STX_STRING", "")),
-            "SRX_STRING": re.sub(r"[^A-Z0-9 ]", "", qso_dict.get("SRX_STRING", "")),
-            "COMMENT": re.sub(r"[^A-Z0-9 ]", "", qso_dict.get("COMMENT", "")),
+            "STX_STRING": re.sub(r"[^A-Z0-9 ]", "", qso.stx_string),
+            "SRX_STRING": re.sub(r"[^A-Z0-9 ]", "", qso.srx_string),
+            "COMMENT": re.sub(r"[^A-Z0-9 ]", "", qso.comment),
         }
 
         for possible_area in possible_areas.values():
@@ -81,12 +171,12 @@ class AdifService:
             return callsign[:slash_index]
         return callsign
 
-    def _get_spotter(self, qso_dict: dict) -> str:
+    def _get_spotter(self, qso: AdifRecord) -> str:
         """
-        Extract the spotter from the QSO dictionary.
+        Extract the spotter from the QSO record.
         """
-        station_callsign = self._clean_callsign(qso_dict.get("STATION_CALLSIGN", ""))
-        operator = self._clean_callsign(qso_dict.get("OPERATOR", ""))
+        station_callsign = self._clean_callsign(qso.station_callsign)
+        operator = self._clean_callsign(qso.operator)
 
         if station_callsign == self.spotter_callsign:
             return self.spotter_callsign
@@ -94,20 +184,69 @@ class AdifService:
             return self.spotter_callsign
         return ""  # No spotter found
 
-    def get_valid_entries(self) -> list[QSO]:
+    def get_valid_entries(self) -> list["QSO"]:
         """
         Get all valid entries from the QSO list.
         """
         valid_entries = []
         for qso in self.qsos:
-            areas = self._get_areas(qso)
+            areas = AREA_MATCHER.find_areas(qso.stx_string, qso.srx_string, qso.comment)
+            qso_date, qso_at = parse_qso_time(qso.qso_date, qso.time_on)
             for area in areas:
                 entry = {
-                    "date": qso.get("QSO_DATE", ""),
-                    "freq": qso.get("FREQ", ""),
+                    "date": qso.qso_date,
+                    "qso_date": qso_date,
+                    "qso_at": qso_at,
+                    "freq": qso.freq,
                     "spotter": self._get_spotter(qso),
-                    "dx": self._clean_callsign(qso.get("CALL", "")),
+                    "dx": self._clean_callsign(qso.call),
                     "area": area,
                 }
                 valid_entries.append(entry)
         return valid_entries
+
+    def get_valid_columns(self) -> QSOColumns:
+        """
+        Batch version of get_valid_entries for large logs.
+        Works column by column over the whole log instead of building a dict
+        per entry. All entries are attributed to the uploading spotter.
+        """
+        columns = QSOColumns(spotter=self.spotter_callsign)
+        if not self.qsos:
+            return columns
+
+        dates, times, freqs, _, _, calls, stx, srx, comments = zip(*self.qsos)
+
+        # Area extraction column by column, matching each distinct value once
+        area_columns = []
+        for values in (stx, srx, comments):
+            matches = {value: AREA_MATCHER.match(value) for value in set(values)}
+            area_columns.append(map(matches.__getitem__, values))
+
+        # Flatten to (index, area) hits, keeping field order within a QSO
+        hits = [
+            (i, area)
+            for i, qso_areas in enumerate(zip(*area_columns))
+            for area in qso_areas
+            if area
+        ]
+        if not hits:
+            return columns
+
+        indexes, columns.area = map(list, zip(*hits))
+
+        # Normalize each distinct callsign and frequency only once
+        clean_calls = {call: self._clean_callsign(call) for call in set(calls)}
+        parsed_freqs = {freq: _parse_freq(freq) for freq in set(freqs)}
+        parsed_dates = {value: _parse_qso_date(value) for value in set(dates)}
+        parsed_times = {value: _parse_time_on(value) for value in set(times)}
+
+        columns.date = [dates[i] for i in indexes]
+        columns.qso_date = [parsed_dates[dates[i]] for i in indexes]
+        columns.qso_at = [
+            _qso_timestamp(parsed_dates[dates[i]], parsed_times[times[i]])
+            for i in indexes
+        ]
+        columns.freq = array("d", [parsed_freqs[freqs[i]] for i in indexes])
+        columns.dx = [clean_calls[calls[i]] for i in indexes]
+        return columns
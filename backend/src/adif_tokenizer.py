@@ -0,0 +1,163 @@
+import re
+from typing import NamedTuple
+
+# A tag longer than this can't be a real ADIF tag, so stray text is dropped
+MAX_TAG_LENGTH = 256
+
+# Longest declared field value accepted. Values are buffered until complete,
+# so a bogus length would otherwise hold the rest of the upload in memory.
+MAX_FIELD_LENGTH = 64 * 1024
+MAX_LENGTH_DIGITS = len(str(MAX_FIELD_LENGTH))
+
+TAG_PATTERN = re.compile(rb"<(?:(eor|eoh)|(\w+):(\d+)(?::[^<>]*)?)>", re.IGNORECASE)
+
+# A tag plus everything up to the next '<'. Where every value fits in that
+# text (no value contains '<'), findall tokenizes a run of records in C.
+FIELD_RUN_PATTERN = re.compile(
+    rb"<(?:(eor|eoh)|(\w+):(\d+)(?::[^<>]*)?)>([^<]*)", re.IGNORECASE
+)
+
+
+class AdifParseError(ValueError):
+    """The upload can't be read as ADIF."""
+
+
+class AdifRecord(NamedTuple):
+    """The ADIF fields needed for award processing, one tuple per QSO."""
+
+    qso_date: str = ""
+    time_on: str = ""
+    freq: str = ""
+    station_callsign: str = ""
+    operator: str = ""
+    call: str = ""
+    stx_string: str = ""
+    srx_string: str = ""
+    comment: str = ""
+
+
+# ADIF field names in AdifRecord order
+REQUIRED_FIELDS = tuple(field.upper() for field in AdifRecord._fields)
+
+_FIELD_INDEX = {field.encode("ascii"): i for i, field in enumerate(REQUIRED_FIELDS)}
+
+
+class AdifTokenizer:
+    """
+    Incremental, length-aware ADIF (.adi) tokenizer.
+
+    Bytes are fed in arbitrary chunks and complete records are returned as soon
+    as their <EOR> marker is seen. Field values are sliced using the declared
+    <FIELD:length> prefix, so values may contain '<' or '>' characters.
+    Only the fields in REQUIRED_FIELDS are decoded, everything else is skipped.
+    Header fields (everything before <EOH>) are discarded.
+    Raises AdifParseError for a field declared longer than MAX_FIELD_LENGTH.
+
+    Runs of complete records go through a findall fast path, the tag by tag
+    loop handles the rest (values containing '<', a record split across
+    chunks) with the same results.
+    """
+
+    def __init__(self):
+        self._buffer = b""
+        self._values = [""] * len(REQUIRED_FIELDS)
+        self._has_fields = False
+
+    def feed(self, data: bytes) -> list[AdifRecord]:
+        """
+        Add a chunk of data and return all records completed by it.
+        """
+        buffer = self._buffer + data if self._buffer else data
+        records = []
+        pos = self._feed_complete_records(buffer, records)
+
+        while True:
+            match = TAG_PATTERN.search(buffer, pos)
+            if not match:
+                # Keep a possibly incomplete tag for the next chunk
+                tag_start = buffer.rfind(b"<", pos)
+                if tag_start != -1 and len(buffer) - tag_start <= MAX_TAG_LENGTH:
+                    pos = tag_start
+                else:
+                    pos = len(buffer)
+                break
+
+            marker, field, length = match.group(1, 2, 3)
+            if marker:
+                if marker.upper() == b"EOR" and self._has_fields:
+                    records.append(AdifRecord._make(self._values))
+                # <EOH> ends the header, so its fields are dropped here as well
+                self._values = [""] * len(REQUIRED_FIELDS)
+                self._has_fields = False
+                pos = match.end()
+                continue
+
+            # Check the digit count first, int() of a huge string is slow
+            if len(length) > MAX_LENGTH_DIGITS or int(length) > MAX_FIELD_LENGTH:
+                raise AdifParseError(
+                    f"Field {field.decode()} is longer than {MAX_FIELD_LENGTH} bytes"
+                )
+            value_end = match.end() + int(length)
+            if value_end > len(buffer):
+                # Value is split across chunks, wait for more data
+                pos = match.start()
+                break
+
+            self._has_fields = True
+            index = _FIELD_INDEX.get(field.upper())
+            if index is not None:
+                value = buffer[match.end() : value_end]
+                self._values[index] = value.decode("utf-8", errors="replace").strip()
+            pos = value_end
+
+        self._buffer = buffer[pos:]
+        return records
+
+    def _feed_complete_records(self, buffer: bytes, records: list) -> int:
+        """
+        Fast path over the buffer up to its last <EOR>, using one findall.
+        Returns where the tag loop in feed should continue: after that <EOR>,
+        or 0 if some value contains '<' (or is too long) and the run has to
+        be tokenized tag by tag instead.
+        """
+        end = max(buffer.rfind(b"<EOR>"), buffer.rfind(b"<eor>"))
+        if end == -1:
+            return 0
+        end += len(b"<EOR>")
+
+        run_records = []
+        values = self._values.copy()
+        has_fields = self._has_fields
+        # Field name as written -> AdifRecord index, saves an upper() per tag
+        indexes = {}
+        for marker, field, length, text in FIELD_RUN_PATTERN.findall(buffer, 0, end):
+            if marker:
+                if has_fields and marker.upper() == b"EOR":
+                    run_records.append(AdifRecord._make(values))
+                values = [""] * len(REQUIRED_FIELDS)
+                has_fields = False
+                continue
+            if len(length) > MAX_LENGTH_DIGITS:
+                return 0
+            length = int(length)
+            if length > len(text) or length > MAX_FIELD_LENGTH:
+                return 0
+            has_fields = True
+            index = indexes.get(field, -1)
+            if index == -1:
+                index = indexes[field] = _FIELD_INDEX.get(field.upper())
+            if index is not None:
+                value = text[:length]
+                values[index] = value.decode("utf-8", errors="replace").strip()
+
+        records.extend(run_records)
+        self._values = values
+        self._has_fields = has_fields
+        return end
+
+
+def tokenize_adif(data: bytes) -> list[AdifRecord]:
+    """
+    Tokenize a complete ADIF document in one pass.
+    """
+    return AdifTokenizer().feed(data)
@@ -0,0 +1,507 @@
+# Bit index of every area code in the stored progress bitsets (see
+# progress.py): AREA_BIT_ORDER[i] is bit i. Append-only: add new codes at
+# the end, and never reorder or remove codes, even ones dropped from
+# area_grids.AREAS, or stored bitsets would decode to the wrong areas.
+AREA_BIT_ORDER = (
+    "H03AK",
+    "H04AK",
+    "H05AK",
+    "H06AK",
+    "J03AK",
+    "J04AK",
+    "J05AK",
+    "J06AK",
+    "J07AK",
+    "K03AK",
+    "K04AK",
+    "K05AK",
+    "K06AK",
+    "L03AK",
+    "L04AK",
+    "L05AK",
+    "M04AK",
+    "B21AS",
+    "C18AS",
+    "C19AS",
+    "C20AS",
+    "C21AS",
+    "D16AS",
+    "D17AS",
+    "D18AS",
+    "D19AS",
+    "D20AS",
+    "D21AS",
+    "E16AS",
+    "E17AS",
+    "E18AS",
+    "E19AS",
+    "E20AS",
+    "E21AS",
+    "F17AS",
+    "F18AS",
+    "F19AS",
+    "F20AS",
+    "F21AS",
+    "G19AS",
+    "G20AS",
+    "G21AS",
+    "A21AZ",
+    "A22AZ",
+    "A23AZ",
+    "B20AZ",
+    "B21AZ",
+    "B22AZ",
+    "B23AZ",
+    "C19AZ",
+    "C20AZ",
+    "C21AZ",
+    "Z22AZ",
+    "Z23AZ",
+    "H18BL",
+    "H19BL",
+    "J18BL",
+    "J19BL",
+    "K17BL",
+    "K18BL",
+    "K19BL",
+    "K20BL",
+    "K21BL",
+    "L17BL",
+    "L18BL",
+    "L19BL",
+    "L20BL",
+    "L21BL",
+    "M17BL",
+    "M18BL",
+    "A22BS",
+    "A23BS",
+    "A24BS",
+    "A25BS",
+    "A26BS",
+    "A27BS",
+    "B21BS",
+    "B22BS",
+    "B23BS",
+    "B24BS",
+    "B25BS",
+    "B26BS",
+    "B27BS",
+    "B28BS",
+    "B29BS",
+    "C21BS",
+    "C22BS",
+    "C23BS",
+    "C24BS",
+    "C25BS",
+    "C26BS",
+    "C27BS",
+    "C28BS",
+    "C29BS",
+    "C30BS",
+    "C31BS",
+    "C32BS",
+    "C33BS",
+    "D20BS",
+    "D21BS",
+    "D22BS",
+    "D23BS",
+    "D24BS",
+    "D25BS",
+    "D26BS",
+    "D27BS",
+    "D28BS",
+    "D29BS",
+    "D30BS",
+    "D31BS",
+    "D32BS",
+    "D33BS",
+    "D34BS",
+    "D35BS",
+    "E21BS",
+    "E22BS",
+    "E23BS",
+    "E24BS",
+    "E25BS",
+    "E26BS",
+    "E27BS",
+    "E28BS",
+    "E29BS",
+    "E30BS",
+    "E31BS",
+    "E32BS",
+    "E33BS",
+    "E34BS",
+    "E35BS",
+    "E36BS",
+    "E37BS",
+    "E38BS",
+    "F21BS",
+    "F22BS",
+    "F23BS",
+    "F24BS",
+    "F25BS",
+    "F26BS",
+    "F27BS",
+    "F28BS",
+    "F29BS",
+    "F30BS",
+    "F31BS",
+    "F32BS",
+    "F33BS",
+    "F34BS",
+    "F35BS",
+    "F36BS",
+    "F37BS",
+    "F38BS",
+    "F39BS",
+    "F40BS",
+    "F41BS",
+    "F42BS",
+    "F43BS",
+    "G22BS",
+    "G23BS",
+    "G24BS",
+    "G25BS",
+    "G26BS",
+    "G27BS",
+    "G28BS",
+    "G29BS",
+    "G30BS",
+    "G31BS",
+    "G32BS",
+    "G33BS",
+    "G34BS",
+    "G35BS",
+    "G36BS",
+    "G37BS",
+    "G38BS",
+    "G39BS",
+    "G40BS",
+    "G41BS",
+    "G42BS",
+    "G43BS",
+    "H22BS",
+    "H23BS",
+    "H24BS",
+    "H25BS",
+    "H26BS",
+    "H27BS",
+    "H28BS",
+    "H29BS",
+    "H30BS",
+    "H31BS",
+    "H32BS",
+    "H33BS",
+    "H34BS",
+    "H35BS",
+    "H36BS",
+    "H37BS",
+    "H38BS",
+    "H39BS",
+    "H40BS",
+    "H41BS",
+    "J22BS",
+    "J23BS",
+    "J24BS",
+    "J25BS",
+    "J26BS",
+    "J27BS",
+    "J28BS",
+    "J29BS",
+    "J30BS",
+    "J31BS",
+    "J32BS",
+    "J33BS",
+    "J34BS",
+    "J35BS",
+    "J36BS",
+    "J37BS",
+    "K21BS",
+    "K22BS",
+    "K23BS",
+    "K24BS",
+    "K25BS",
+    "K26BS",
+    "K27BS",
+    "K28BS",
+    "K29BS",
+    "K30BS",
+    "L20BS",
+    "L21BS",
+    "L22BS",
+    "L23BS",
+    "L24BS",
+    "L25BS",
+    "L26BS",
+    "L27BS",
+    "L28BS",
+    "M25BS",
+    "M26BS",
+    "F21HB",
+    "F22HB",
+    "G19HB",
+    "G20HB",
+    "G21HB",
+    "G22HB",
+    "H18HB",
+    "H19HB",
+    "H20HB",
+    "H21HB",
+    "H22HB",
+    "J19HB",
+    "J20HB",
+    "J21HB",
+    "J22HB",
+    "K19HB",
+    "K20HB",
+    "K21HB",
+    "K22HB",
+    "L21HB",
+    "F09HD",
+    "F10HD",
+    "G06HD",
+    "G07HD",
+    "G08HD",
+    "G09HD",
+    "G10HD",
+    "H07HD",
+    "H08HD",
+    "H09HD",
+    "H10HD",
+    "H11HD",
+    "J09HD",
+    "J10HD",
+    "G06HF",
+    "G07HF",
+    "H05HF",
+    "H06HF",
+    "H07HF",
+    "H08HF",
+    "J05HF",
+    "J06HF",
+    "J07HF",
+    "N01HG",
+    "N03HG",
+    "N04HG",
+    "N05HG",
+    "O00HG",
+    "O01HG",
+    "O02HG",
+    "O03HG",
+    "O04HG",
+    "O05HG",
+    "O06HG",
+    "O07HG",
+    "P00HG",
+    "P01HG",
+    "P02HG",
+    "P03HG",
+    "P04HG",
+    "P05HG",
+    "P06HG",
+    "P07HG",
+    "Q03HG",
+    "Q04HG",
+    "Q05HG",
+    "F10HS",
+    "F11HS",
+    "F12HS",
+    "F13HS",
+    "G10HS",
+    "G11HS",
+    "G12HS",
+    "H11HS",
+    "H12HS",
+    "H10JN",
+    "J09JN",
+    "J10JN",
+    "J11JN",
+    "K09JN",
+    "K10JN",
+    "K11JN",
+    "L09JN",
+    "L10JN",
+    "L11JN",
+    "L12JN",
+    "M10JN",
+    "M11JN",
+    "M12JN",
+    "F17JS",
+    "F18JS",
+    "F19JS",
+    "G16JS",
+    "G17JS",
+    "G18JS",
+    "G19JS",
+    "H16JS",
+    "H17JS",
+    "H18JS",
+    "H19JS",
+    "J16JS",
+    "J17JS",
+    "J18JS",
+    "K16JS",
+    "K17JS",
+    "K18JS",
+    "L05KT",
+    "L06KT",
+    "L07KT",
+    "M05KT",
+    "M06KT",
+    "M07KT",
+    "M08KT",
+    "N04KT",
+    "N05KT",
+    "N06KT",
+    "N07KT",
+    "N08KT",
+    "O05KT",
+    "O06KT",
+    "O07KT",
+    "F12PT",
+    "F13PT",
+    "F14PT",
+    "F15PT",
+    "G12PT",
+    "G13PT",
+    "G14PT",
+    "G15PT",
+    "H12PT",
+    "H14PT",
+    "H15PT",
+    "G15RA",
+    "G16RA",
+    "G17RA",
+    "H14RA",
+    "H15RA",
+    "H16RA",
+    "H17RA",
+    "J14RA",
+    "J15RA",
+    "J16RA",
+    "J17RA",
+    "K14RA",
+    "K15RA",
+    "K16RA",
+    "K17RA",
+    "L14RA",
+    "L15RA",
+    "L16RA",
+    "L17RA",
+    "D16RH",
+    "D17RH",
+    "E15RH",
+    "E16RH",
+    "E17RH",
+    "E18RH",
+    "F15RH",
+    "F16RH",
+    "F17RH",
+    "F18RH",
+    "F15RM",
+    "F16RM",
+    "F17RM",
+    "G15RM",
+    "G16RM",
+    "G17RM",
+    "H15RM",
+    "H16RM",
+    "J11SM",
+    "J12SM",
+    "J13SM",
+    "K11SM",
+    "K12SM",
+    "K13SM",
+    "K14SM",
+    "L12SM",
+    "L13SM",
+    "L14SM",
+    "E13TA",
+    "E14TA",
+    "E15TA",
+    "F13TA",
+    "F14TA",
+    "F15TA",
+    "G12TK",
+    "G13TK",
+    "G14TK",
+    "H10TK",
+    "H11TK",
+    "H12TK",
+    "H13TK",
+    "H14TK",
+    "J10TK",
+    "J11TK",
+    "J12TK",
+    "J13TK",
+    "J14TK",
+    "K13TK",
+    "K14TK",
+    "L11YN",
+    "L12YN",
+    "L13YN",
+    "L14YN",
+    "L15YN",
+    "L16YN",
+    "L17YN",
+    "L19YN",
+    "L20YN",
+    "L21YN",
+    "M10YN",
+    "M11YN",
+    "M12YN",
+    "M13YN",
+    "M14YN",
+    "M15YN",
+    "M16YN",
+    "M17YN",
+    "M18YN",
+    "M19YN",
+    "N11YN",
+    "N12YN",
+    "N13YN",
+    "N14YN",
+    "N15YN",
+    "N16YN",
+    "N17YN",
+    "N18YN",
+    "H07YZ",
+    "H08YZ",
+    "H09YZ",
+    "J06YZ",
+    "J07YZ",
+    "J08YZ",
+    "J09YZ",
+    "K06YZ",
+    "K07YZ",
+    "K08YZ",
+    "K09YZ",
+    "L06YZ",
+    "L07YZ",
+    "L08YZ",
+    "L09YZ",
+    "L10YZ",
+    "M08YZ",
+    "M09YZ",
+    "M10YZ",
+    "M11YZ",
+    "N08YZ",
+    "N09YZ",
+    "N10YZ",
+    "N11YZ",
+    "L03ZF",
+    "L04ZF",
+    "L05ZF",
+    "M02ZF",
+    "M03ZF",
+    "M04ZF",
+    "M05ZF",
+    "N01ZF",
+    "N02ZF",
+    "N03ZF",
+    "N04ZF",
+    "N05ZF",
+    "O01ZF",
+    "O02ZF",
+    "O03ZF",
+)
@@ -0,0 +1,105 @@
+import hashlib
+import os
+import pickle
+import tempfile
+
+# Prebuilt index of the award areas, so processes (including every ingest
+# pool worker) load it with a single unpickle instead of importing the
+# area_grids literal and deriving the lookups from it.
+SNAPSHOT_PATH = os.path.join(os.path.dirname(__file__), "area_index.pickle")
+SOURCE_PATHS = tuple(
+    os.path.join(os.path.dirname(__file__), name)
+    for name in ("area_grids.py", "area_bit_order.py")
+)
+
+# Bump when the snapshot layout changes
+SNAPSHOT_FORMAT = 1
+
+
+def _source_hash() -> str:
+    digest = hashlib.sha256()
+    for path in SOURCE_PATHS:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def build_area_index(source_hash: str) -> dict:
+    """
+    Everything derived from area_grids.AREAS and the bit order, see
+    progress.py. Raises ValueError if an area has no bit yet.
+    """
+    from area_bit_order import AREA_BIT_ORDER
+    from area_grids import AREAS
+
+    unassigned = [
+        area for codes in AREAS.values() for area in codes if area not in AREA_BIT_ORDER
+    ]
+    if unassigned:
+        raise ValueError(
+            f"Areas missing from area_bit_order.AREA_BIT_ORDER: {unassigned}, "
+            "append them at the end"
+        )
+    area_codes = AREA_BIT_ORDER
+    area_bits = {area: 1 << i for i, area in enumerate(area_codes)}
+    return {
+        "format": SNAPSHOT_FORMAT,
+        "source_hash": source_hash,
+        # Fingerprint of the bit order, for anything persisting the bitsets
+        "version": hashlib.sha256(",".join(area_codes).encode()).hexdigest()[:16],
+        "areas": AREAS,
+        "area_codes": area_codes,
+        "region_codes": tuple(AREAS),
+        "area_bits": area_bits,
+        "region_masks": {
+            region: sum(area_bits[area] for area in codes)
+            for region, codes in AREAS.items()
+        },
+    }
+
+
+def write_snapshot(index: dict, path: str = SNAPSHOT_PATH):
+    # Write then rename, so concurrent readers never see a partial file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def load_area_index() -> dict:
+    """
+    Load the snapshot, or rebuild it when it is missing or area_grids.py or
+    area_bit_order.py has changed since it was built. Rebuilding tries to refresh the snapshot
+    but works from a read-only tree too.
+    """
+    source_hash = _source_hash()
+    try:
+        with open(SNAPSHOT_PATH, "rb") as f:
+            index = pickle.load(f)
+        if (
+            index.get("format") == SNAPSHOT_FORMAT
+            and index.get("source_hash") == source_hash
+        ):
+            return index
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError):
+        pass
+
+    index = build_area_index(source_hash)
+    try:
+        write_snapshot(index)
+    except OSError:
+        pass
+    return index
+
+
+AREA_INDEX = load_area_index()
+
+
+if __name__ == "__main__":
+    # Build the snapshot ahead of time, e.g. in the Docker image
+    write_snapshot(build_area_index(_source_hash()))
+    print(f"Wrote {SNAPSHOT_PATH} (version {AREA_INDEX['version']})")
@@ -0,0 +1,59 @@
+import re
+from area_index import AREA_INDEX
+
+# Anything that can't be part of an area code or a word separator
+NON_AREA_CHARS = re.compile(r"[^A-Z0-9 ]")
+
+# Exchange strings repeat a lot within a log (STX_STRING is usually constant),
+# so matches are memoized up to this many distinct values
+MATCH_CACHE_SIZE = 4096
+
+
+class AreaMatcher:
+    """
+    Hashed index of all award area codes, built once from area_grids.AREAS
+    (via the area_index snapshot).
+
+    Matches the behaviour of AdifService._get_areas: each field is stripped of
+    characters outside [A-Z0-9 ], split into words, and the first word that is
+    a known area code is taken as that field's area.
+    """
+
+    def __init__(self, areas: dict[str, list[str]]):
+        self.areas = frozenset(area for codes in areas.values() for area in codes)
+        self._cache = {}
+
+    def match(self, value: str) -> str:
+        """
+        Return the first valid area in a single field, or empty string if none.
+        """
+        cached = self._cache.get(value)
+        if cached is not None:
+            return cached
+
+        area = ""
+        for word in NON_AREA_CHARS.sub("", value).split():
+            if word in self.areas:
+                area = word
+                break
+
+        if len(self._cache) >= MATCH_CACHE_SIZE:
+            self._cache.clear()
+        self._cache[value] = area
+        return area
+
+    def find_areas(self, *values: str) -> list[str]:
+        """
+        Scan the given fields (STX_STRING, SRX_STRING, COMMENT) and return
+        the area found in each of them, in order.
+        """
+        areas = []
+        for value in values:
+            if value:
+                area = self.match(value)
+                if area:
+                    areas.append(area)
+        return areas
+
+
+AREA_MATCHER = AreaMatcher(AREA_INDEX["areas"])
@@ -0,0 +1,162 @@
+import asyncio
+import os
+import time
+from typing import Optional
+import httpx
+import jwt
+from dotenv import load_dotenv
+from fastapi import Request
+from cache import TTLCache
+
+load_dotenv()
+
+# Clerk's Backend API serves the instance's JWKS (authenticated by secret key)
+CLERK_JWKS_URL = os.getenv("CLERK_JWKS_URL", "https://api.clerk.com/v1/jwks")
+
+# Optional PEM public key from the Clerk dashboard; when set, no JWKS is fetched
+CLERK_JWT_KEY = os.getenv("CLERK_JWT_KEY", "")
+
+# How long fetched keys are trusted before the background refresh replaces them
+JWKS_TTL = float(os.getenv("CLERK_JWKS_TTL", "3600"))
+
+# Unknown key IDs trigger a refresh at most this often (key rotation)
+JWKS_MIN_REFRESH_INTERVAL = 30.0
+
+# Recently verified tokens, so repeated requests skip the signature check
+TOKEN_CACHE_SIZE = int(os.getenv("AUTH_TOKEN_CACHE_SIZE", "1024"))
+
+# Clock skew tolerated on exp/nbf/iat
+CLOCK_SKEW_SECONDS = 5
+
+
+class JWKSCache:
+    """
+    Signing keys by key ID, fetched from a JWKS endpoint and cached with a TTL.
+    Keys can also be set directly (static PEM key or a local test key set).
+    """
+
+    def __init__(self, url: str, headers: dict, ttl: float):
+        self.url = url
+        self.headers = headers
+        self.ttl = ttl
+        self._keys = {}
+        self._static_key = None
+        # -inf rather than 0: the monotonic clock may start below the TTL
+        self._fetched_at = float("-inf")
+        self._lock = asyncio.Lock()
+
+    def set_keys(self, jwks: dict):
+        self._keys = {jwk["kid"]: jwt.PyJWK(jwk).key for jwk in jwks.get("keys", [])}
+        self._fetched_at = time.monotonic()
+
+    def set_static_key(self, pem: str):
+        # Env files often carry the PEM with escaped newlines
+        self._static_key = pem.replace("\\n", "\n")
+
+    @property
+    def is_stale(self) -> bool:
+        return time.monotonic() - self._fetched_at > self.ttl
+
+    async def refresh(self, force: bool = False):
+        async with self._lock:
+            since_fetch = time.monotonic() - self._fetched_at
+            if not force and not self.is_stale:
+                return
+            if force and since_fetch < JWKS_MIN_REFRESH_INTERVAL:
+                return
+            self.set_keys(await self._fetch())
+
+    async def _fetch(self) -> dict:
+        async with httpx.AsyncClient(timeout=10) as client:
+            response = await client.get(self.url, headers=self.headers)
+            response.raise_for_status()
+        return response.json()
+
+    async def get_key(self, kid: Optional[str]):
+        if self._static_key is not None:
+            return self._static_key
+        if self.is_stale:
+            await self.refresh()
+        key = self._keys.get(kid)
+        if key is None:
+            # Possibly a rotated key we haven't seen yet
+            await self.refresh(force=True)
+            key = self._keys.get(kid)
+        if key is None:
+            raise jwt.InvalidTokenError(f"Unknown signing key: {kid}")
+        return key
+
+    async def run_refresh_loop(self):
+        """
+        Keep the key set fresh in the background so requests never wait on it.
+        """
+        while True:
+            try:
+                await self.refresh(force=True)
+            except Exception as e:
+                print(f"JWKS refresh failed: {e}")
+            await asyncio.sleep(self.ttl / 2)
+
+
+class SessionVerifier:
+    """
+    Verifies Clerk session JWTs locally against the cached JWKS.
+    """
+
+    def __init__(self, jwks: JWKSCache, authorized_parties: list[str]):
+        self.jwks = jwks
+        self.authorized_parties = authorized_parties
+        self._verified = TTLCache(maxsize=TOKEN_CACHE_SIZE, ttl=JWKS_TTL)
+
+    async def verify(self, token: str) -> str:
+        """
+        Verify a session token and return its user ID (the `sub` claim).
+        Raises jwt.InvalidTokenError if the token isn't valid.
+        """
+        user_id = self._verified.get(token)
+        if user_id is not None:
+            return user_id
+
+        header = jwt.get_unverified_header(token)
+        key = await self.jwks.get_key(header.get("kid"))
+        claims = jwt.decode(
+            token,
+            key,
+            algorithms=["RS256"],
+            leeway=CLOCK_SKEW_SECONDS,
+            options={"require": ["exp", "iat", "sub"]},
+        )
+
+        azp = claims.get("azp")
+        if azp and self.authorized_parties and azp not in self.authorized_parties:
+            raise jwt.InvalidTokenError(f"Unauthorized party: {azp}")
+
+        user_id = claims["sub"]
+        self._verified.set(token, user_id, ttl=claims["exp"] - time.time())
+        return user_id
+
+
+jwks_cache = JWKSCache(
+    url=CLERK_JWKS_URL,
+    headers={"Authorization": f"Bearer {os.getenv('CLERK_SECRET_KEY', '')}"},
+    ttl=JWKS_TTL,
+)
+if CLERK_JWT_KEY:
+    jwks_cache.set_static_key(CLERK_JWT_KEY)
+
+session_verifier = SessionVerifier(
+    jwks_cache,
+    authorized_parties=[os.getenv("FRONTEND_URL", "http://localhost:5173")],
+)
+
+
+def get_session_token(request: Request) -> Optional[str]:
+    """
+    Session token from the Authorization header, or Clerk's __session cookie.
+    """
+    authorization = request.headers.get("Authorization")
+    if authorization:
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() == "bearer" and token:
+            return token.strip()
+    return request.cookies.get("__session")
@@ -1,19 +1,199 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool, QueuePool
+from fastapi import Request, Response
+from metrics import DB_POOL_CHECKOUT_SECONDS, DB_POOL_TIMEOUTS, Gauge
+from uuid import uuid4
 import os
+import time
 
 # Database URL - you can change this to your PostgreSQL connection string
 DATABASE_URL = os.getenv(
     "DATABASE_URL", "postgresql://yoav.katzman@localhost:5433/holyland_award"
 )
 
-engine = create_engine(DATABASE_URL)
+
+def _asyncpg_url(url: str) -> str:
+    return (
+        make_url(url)
+        .set(drivername="postgresql+asyncpg")
+        .render_as_string(hide_password=False)
+    )
+
+
+# Same database through asyncpg, for routes that shouldn't block the event loop
+ASYNC_DATABASE_URL = os.getenv("ASYNC_DATABASE_URL", _asyncpg_url(DATABASE_URL))
+
+# Optional read replica for the read-only routes (see get_read_db). Reads
+# use the primary when unset.
+DATABASE_READ_URL = os.getenv("DATABASE_READ_URL", "")
+
+# Seconds a client's reads stay on the primary after it wrote, long enough
+# for the replica to catch up
+READ_YOUR_WRITES_SECONDS = int(os.getenv("READ_YOUR_WRITES_SECONDS", "10"))
+READ_PRIMARY_COOKIE = "read_primary"
+READ_PRIMARY_HEADER = "X-Read-Primary"
+
+# Pool settings, per engine (sync and async) and per process. Each uvicorn
+# worker has its own pools, so the server may see up to
+# workers * 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW) connections.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "10"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+# Seconds before a connection is replaced, to stay under server/proxy idle limits
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "1") == "1"
+# Connections opened per pool at startup
+DB_POOL_WARM = int(os.getenv("DB_POOL_WARM", str(DB_POOL_SIZE)))
+
+# Behind PgBouncer in transaction mode: PgBouncer does the pooling, and
+# server connections change between transactions, so asyncpg must not
+# keep prepared statements around.
+DB_PGBOUNCER = os.getenv("DB_PGBOUNCER", "0") == "1"
+
+
+class _TimedCheckout:
+    """Records how long checkouts wait for a connection, per engine label."""
+
+    label = ""
+
+    def _do_get(self):
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            DB_POOL_TIMEOUTS.labels(self.label).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(self.label).observe(
+                time.perf_counter() - start
+            )
+
+
+class _TimedQueuePool(_TimedCheckout, QueuePool):
+    label = "sync"
+
+
+class _TimedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    label = "async"
+
+
+class _TimedReadQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    label = "read"
+
+
+def _pool_options(poolclass) -> dict:
+    if DB_PGBOUNCER:
+        return {"poolclass": NullPool}
+    return {
+        "poolclass": poolclass,
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+
+
+# psycopg2 doesn't prepare statements server-side, so needs no PgBouncer options
+engine = create_engine(DATABASE_URL, **_pool_options(_TimedQueuePool))
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def _create_async_engine(url: str, poolclass):
+    return create_async_engine(
+        url,
+        connect_args=(
+            {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                # Unique names, so statements never clash on a shared server connection
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            }
+            if DB_PGBOUNCER
+            else {}
+        ),
+        **_pool_options(poolclass),
+    )
+
+
+async_engine = _create_async_engine(ASYNC_DATABASE_URL, _TimedAsyncQueuePool)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, autoflush=False, expire_on_commit=False
+)
+
+async_read_engine = (
+    _create_async_engine(_asyncpg_url(DATABASE_READ_URL), _TimedReadQueuePool)
+    if DATABASE_READ_URL
+    else async_engine
+)
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine, autoflush=False, expire_on_commit=False
+)
+
 Base = declarative_base()
 
 
+# Pools to report on; none with PgBouncer, where NullPool keeps no connections
+_POOLS = [
+    (label, e.pool)
+    for label, e in (
+        ("sync", engine),
+        ("async", async_engine),
+        ("read", async_read_engine),
+    )
+    if isinstance(e.pool, QueuePool) and (label != "read" or DATABASE_READ_URL)
+]
+
+
+def _pool_gauge(name: str, help: str, read) -> Gauge:
+    return Gauge(
+        name, help, ("engine",), lambda: {(label,): read(p) for label, p in _POOLS}
+    )
+
+
+_pool_gauge(
+    "holyland_db_pool_size", "Connections kept in the pool.", lambda p: p.size()
+)
+_pool_gauge(
+    "holyland_db_pool_checked_out",
+    "Connections currently in use.",
+    lambda p: p.checkedout(),
+)
+_pool_gauge(
+    "holyland_db_pool_overflow",
+    "Connections opened beyond the pool size.",
+    lambda p: max(p.overflow(), 0),
+)
+_pool_gauge(
+    "holyland_db_pool_saturation",
+    "Connections in use as a fraction of the most the pool will open.",
+    lambda p: p.checkedout() / max(DB_POOL_SIZE + max(DB_MAX_OVERFLOW, 0), 1),
+)
+
+
+def warm_sync_pool(count: int = DB_POOL_WARM):
+    """Open `count` connections now rather than on the first requests."""
+    if DB_PGBOUNCER:
+        return
+    connections = [engine.connect() for _ in range(count)]
+    for connection in connections:
+        connection.close()
+
+
+async def warm_async_pool(count: int = DB_POOL_WARM):
+    if DB_PGBOUNCER:
+        return
+    engines = [async_engine, async_read_engine] if DATABASE_READ_URL else [async_engine]
+    connections = [await e.connect() for e in engines for _ in range(count)]
+    for connection in connections:
+        await connection.close()
+
+
 # Dependency to get DB session
 def get_db():
     db = SessionLocal()
@@ -21,3 +201,38 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Dependency to get an async DB session
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Dependency to get an async DB session for read-only routes: on the read
+# replica, unless the client asks to read its own recent writes
+async def get_read_db(request: Request):
+    if (
+        request.cookies.get(READ_PRIMARY_COOKIE)
+        or request.headers.get(READ_PRIMARY_HEADER) == "1"
+    ):
+        sessionmaker = AsyncSessionLocal
+    else:
+        sessionmaker = AsyncReadSessionLocal
+    async with sessionmaker() as db:
+        yield db
+
+
+def read_from_primary(response: Response):
+    """
+    Keep the client's reads on the primary for READ_YOUR_WRITES_SECONDS,
+    e.g. after an upload, so it sees its new QSOs despite replica lag.
+    """
+    if DATABASE_READ_URL:
+        response.set_cookie(
+            READ_PRIMARY_COOKIE,
+            "1",
+            max_age=READ_YOUR_WRITES_SECONDS,
+            httponly=True,
+            samesite="lax",
+        )
@@ -0,0 +1,160 @@
+import asyncio
+import hashlib
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Awaitable, Callable, NamedTuple, Optional
+from starlette.concurrency import run_in_threadpool
+from adif_service import AdifService, QSOColumns
+from adif_tokenizer import AdifTokenizer
+from metrics import AREA_HITS, INGEST_STAGE_SECONDS, QSOS_PARSED
+from profiles.service import current_profile, note_profile
+
+# Number of worker processes for ADIF parsing and area extraction.
+# 0 runs the work inline on the event loop (useful for local debugging).
+INGEST_POOL_WORKERS = int(os.getenv("INGEST_POOL_WORKERS", "2"))
+
+# Uploads allowed to wait for a worker on top of the ones being processed
+INGEST_POOL_MAX_PENDING = int(os.getenv("INGEST_POOL_MAX_PENDING", "8"))
+
+# Size of the upload chunks handed to a worker in one submission
+INGEST_SEGMENT_SIZE = int(os.getenv("INGEST_SEGMENT_SIZE", str(1024 * 1024)))
+
+
+class IngestPoolFullError(Exception):
+    """Raised when the ingest pool can't accept another upload."""
+
+
+class IngestPool:
+    """
+    Process pool for the CPU-bound part of an upload, with a bounded number
+    of uploads in flight. Each upload holds one slot while it is processed;
+    when all slots are taken new uploads are rejected instead of queued,
+    unless they ask to wait (background jobs).
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.capacity = max(workers, 1) + max_pending
+        self.active = 0
+        self._executor = None
+        self._released = asyncio.Condition()
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @asynccontextmanager
+    async def slot(self, wait: bool = False):
+        if self.active >= self.capacity:
+            if not wait:
+                raise IngestPoolFullError(
+                    f"Too many uploads in progress ({self.active}/{self.capacity})"
+                )
+            async with self._released:
+                await self._released.wait_for(lambda: self.active < self.capacity)
+        self.active += 1
+        try:
+            yield
+        finally:
+            self.active -= 1
+            async with self._released:
+                self._released.notify()
+
+    async def run(self, fn, *args):
+        if current_profile.get() is not None:
+            # Keep profiled work in this process so the profile can see it
+            return await run_in_threadpool(fn, *args)
+        if self.workers == 0:
+            return fn(*args)
+        if self._executor is None:
+            # spawn avoids forking the running event loop and its threads
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return await asyncio.get_running_loop().run_in_executor(
+            self._executor, fn, *args
+        )
+
+
+ingest_pool = IngestPool(INGEST_POOL_WORKERS, INGEST_POOL_MAX_PENDING)
+
+
+class SegmentStats(NamedTuple):
+    """Work done on one segment, timed inside the pool worker."""
+
+    records: int
+    parse_seconds: float
+    extract_seconds: float
+
+
+def extract_segment(
+    tokenizer: AdifTokenizer, data: bytes, spotter_callsign: str
+) -> tuple[AdifTokenizer, QSOColumns, SegmentStats]:
+    """
+    Tokenize one segment of an upload and extract its valid entries.
+    Runs in a pool worker; the tokenizer is passed back and forth so records
+    split across segments are completed by the next call.
+    """
+    start = time.perf_counter()
+    records = tokenizer.feed(data)
+    parsed = time.perf_counter()
+    columns = AdifService(records, spotter_callsign).get_valid_columns()
+    stats = SegmentStats(len(records), parsed - start, time.perf_counter() - parsed)
+    return tokenizer, columns, stats
+
+
+async def extract_upload(
+    file,
+    spotter_callsign: str,
+    wait: bool = False,
+    on_segment: Optional[Callable[[int, QSOColumns], Awaitable[None]]] = None,
+) -> QSOColumns:
+    """
+    Read an upload segment by segment and extract its valid entries in the
+    ingest pool, keeping the event loop free for other requests.
+    Raises IngestPoolFullError if the pool is saturated, unless `wait` is set.
+    `on_segment` is awaited with the size and extracted batch of each segment.
+    """
+    tokenizer = AdifTokenizer()
+    columns = QSOColumns(spotter=spotter_callsign)
+    read_seconds = parse_seconds = extract_seconds = 0.0
+    records = 0
+    async with ingest_pool.slot(wait):
+        while True:
+            start = time.perf_counter()
+            segment = await file.read(INGEST_SEGMENT_SIZE)
+            read_seconds += time.perf_counter() - start
+            if not segment:
+                break
+            tokenizer, batch, stats = await ingest_pool.run(
+                extract_segment, tokenizer, segment, spotter_callsign
+            )
+            columns.extend(batch)
+            records += stats.records
+            parse_seconds += stats.parse_seconds
+            extract_seconds += stats.extract_seconds
+            if on_segment:
+                await on_segment(len(segment), batch)
+
+    INGEST_STAGE_SECONDS.labels("read").observe(read_seconds)
+    INGEST_STAGE_SECONDS.labels("parse").observe(parse_seconds)
+    INGEST_STAGE_SECONDS.labels("extract").observe(extract_seconds)
+    QSOS_PARSED.inc(records)
+    note_profile(record_count=records)
+    AREA_HITS.inc(len(columns))
+    return columns
+
+
+async def hash_upload(file) -> str:
+    """
+    SHA-256 hex digest of an upload, computed off the event loop.
+    The file is rewound afterwards so it can still be processed.
+    """
+    digest = await run_in_threadpool(hashlib.file_digest, file.file, "sha256")
+    await file.seek(0)
+    return digest.hexdigest()
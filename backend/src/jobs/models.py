@@ -0,0 +1,37 @@
+import uuid
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    DateTime,
+    ForeignKey,
+    Uuid,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from database import Base
+
+
+class IngestJob(Base):
+    """
+    A /read-file upload processed in the background, see jobs/service.py.
+    """
+
+    __tablename__ = "ingest_jobs"
+
+    id = Column(Uuid, primary_key=True, default=uuid.uuid4)
+    user_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=False)
+    spotter = Column(String, nullable=False)
+    status = Column(
+        String, nullable=False, server_default="queued"
+    )  # queued, running, done or failed
+    stage = Column(String, nullable=True)  # parse, extract, dedupe or insert
+    progress = Column(JSONB, nullable=False, server_default="{}")  # Per stage
+    result = Column(JSONB, nullable=True)  # Upload summary once done
+    error = Column(String, nullable=True)
+    host = Column(String, nullable=True)  # Hostname of the process running it
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,47 @@
+import uuid
+from typing import Optional
+from sqlalchemy import or_, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+from jobs.models import IngestJob
+
+
+async def create_job_async(
+    db: AsyncSession, user_id: int, spotter: str, host: str, progress: dict, **values
+) -> IngestJob:
+    """Create an ingest job, queued unless `values` say otherwise"""
+    job = IngestJob(
+        user_id=user_id, spotter=spotter, host=host, progress=progress, **values
+    )
+    db.add(job)
+    await db.commit()
+    await db.refresh(job)
+    return job
+
+
+async def get_job_async(db: AsyncSession, job_id: uuid.UUID) -> Optional[IngestJob]:
+    """Get ingest job by ID"""
+    return await db.get(IngestJob, job_id)
+
+
+async def update_job_async(db: AsyncSession, job_id: uuid.UUID, **values):
+    """Update an ingest job's status, stage, progress or result"""
+    await db.execute(update(IngestJob).where(IngestJob.id == job_id).values(**values))
+    await db.commit()
+
+
+async def fail_unfinished_jobs_async(db: AsyncSession, host: str, error: str) -> int:
+    """
+    Mark the host's queued and running jobs failed, along with those from
+    before jobs recorded their host. Returns how many were updated.
+    """
+    result = await db.execute(
+        update(IngestJob)
+        .where(
+            IngestJob.status.in_(("queued", "running")),
+            or_(IngestJob.host == host, IngestJob.host.is_(None)),
+        )
+        .values(status="failed", error=error, finished_at=func.now())
+    )
+    await db.commit()
+    return result.rowcount
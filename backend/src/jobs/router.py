@@ -0,0 +1,29 @@
+import uuid
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db, read_from_primary
+from utils import verify_clerk_session
+from users.service import get_cached_user_by_clerk_id
+from jobs.repository import get_job_async
+from jobs.schema import IngestJobResponse
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("/{job_id}", response_model=IngestJobResponse)
+async def get_ingest_job(
+    job_id: uuid.UUID,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
+    user_id: str = Depends(verify_clerk_session),
+):
+    """
+    Status, per-stage progress and final result of a background upload.
+    """
+    user = await get_cached_user_by_clerk_id(db, user_id)
+    job = await get_job_async(db, job_id)
+    if not user or not job or job.user_id != user.id:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == "done":
+        read_from_primary(response)
+    return job
@@ -0,0 +1,19 @@
+import uuid
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Any, Optional
+
+
+class IngestJobResponse(BaseModel):
+    id: uuid.UUID
+    status: str
+    stage: Optional[str]
+    progress: dict[str, Any]
+    result: Optional[dict[str, Any]]
+    error: Optional[str]
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
@@ -0,0 +1,174 @@
+import asyncio
+import os
+import shutil
+import socket
+import tempfile
+import uuid
+from fastapi import UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.sql import func
+from starlette.concurrency import iterate_in_threadpool, run_in_threadpool
+from database import AsyncSessionLocal, SessionLocal
+from ingest import IngestPoolFullError, extract_upload
+from jobs.models import IngestJob
+from jobs.repository import (
+    create_job_async,
+    fail_unfinished_jobs_async,
+    update_job_async,
+)
+from profiles.service import current_profile
+from qsos.repository import (
+    get_known_area_bits,
+    iter_insert_qso_columns,
+    record_upload_async,
+)
+from qsos.service import summarize_new_qsos
+from users.schema import UserResponse
+
+# Uploads up to this size are buffered in memory, larger ones on disk
+INGEST_JOB_SPOOL_SIZE = int(os.getenv("INGEST_JOB_SPOOL_SIZE", str(8 * 1024 * 1024)))
+
+# Background jobs accepted per process before new ones are rejected. Each
+# holds its spooled upload (up to INGEST_JOB_SPOOL_SIZE in memory) until done.
+INGEST_JOB_MAX_QUEUED = int(os.getenv("INGEST_JOB_MAX_QUEUED", "16"))
+
+# Recorded on each job, so a restarted process can fail the jobs it lost.
+# Assumes one app process per host, as in the Docker images.
+JOB_HOST = socket.gethostname()
+
+# Tasks of the jobs running in this process, kept referenced until done
+running_jobs: set[asyncio.Task] = set()
+
+
+async def submit_ingest_job(
+    db: AsyncSession, user: UserResponse, file: UploadFile, sha256: str
+) -> IngestJob:
+    """
+    Queue an upload for background processing and return its job.
+    The request's upload is closed once the response is sent, so it is
+    copied to a spooled temporary file first.
+    Raises IngestPoolFullError when INGEST_JOB_MAX_QUEUED jobs are pending.
+    """
+    if len(running_jobs) >= INGEST_JOB_MAX_QUEUED:
+        raise IngestPoolFullError(
+            f"Too many background uploads ({len(running_jobs)}/{INGEST_JOB_MAX_QUEUED})"
+        )
+
+    spool = tempfile.SpooledTemporaryFile(max_size=INGEST_JOB_SPOOL_SIZE)
+    await run_in_threadpool(shutil.copyfileobj, file.file, spool)
+    size = spool.tell()
+    spool.seek(0)
+
+    job = await create_job_async(
+        db, user.id, user.callsign, JOB_HOST, {"parse": {"done": 0, "total": size}}
+    )
+    task = asyncio.create_task(
+        run_ingest_job(job.id, user.callsign, UploadFile(spool, size=size), sha256)
+    )
+    running_jobs.add(task)
+    task.add_done_callback(running_jobs.discard)
+    return job
+
+
+async def record_duplicate_job(
+    db: AsyncSession, user: UserResponse, summary: dict
+) -> IngestJob:
+    """
+    Job for a background upload identical to one already processed, created
+    done with the earlier summary so clients poll it like any other job.
+    """
+    return await create_job_async(
+        db,
+        user.id,
+        user.callsign,
+        JOB_HOST,
+        {},
+        status="done",
+        result=summary,
+        finished_at=func.now(),
+    )
+
+
+async def run_ingest_job(
+    job_id: uuid.UUID, spotter: str, file: UploadFile, sha256: str
+):
+    """
+    Process a queued upload, recording progress on the job after every step.
+    Parsing and extraction run together per segment in the ingest pool, so
+    both advance during the parse stage. The job waits for a free pool slot
+    instead of failing when the pool is busy.
+    """
+    # The task inherited the submitting request's context; don't profile it
+    current_profile.set(None)
+    progress = {"parse": {"done": 0, "total": file.size}, "extract": {"hits": 0}}
+
+    async with AsyncSessionLocal() as db:
+
+        async def report(**values):
+            await update_job_async(db, job_id, progress=progress, **values)
+
+        async def on_segment(size, batch):
+            progress["parse"]["done"] += size
+            progress["extract"]["hits"] += len(batch)
+            await report(status="running", stage="parse")
+
+        try:
+            try:
+                columns = await extract_upload(
+                    file, spotter, wait=True, on_segment=on_segment
+                )
+            finally:
+                await file.close()
+            await report(status="running", stage="dedupe")
+
+            sync_db = SessionLocal()
+            try:
+                known_bits = await run_in_threadpool(
+                    get_known_area_bits, sync_db, spotter
+                )
+                new_columns = await run_in_threadpool(
+                    columns.first_per_area, known_bits
+                )
+                progress["dedupe"] = {"total": len(columns), "new": len(new_columns)}
+                progress["insert"] = {"inserted": 0, "total": len(new_columns)}
+                await report(stage="insert")
+
+                saved_qsos = []
+                chunks = iter_insert_qso_columns(sync_db, new_columns, known_bits)
+                async for chunk in iterate_in_threadpool(chunks):
+                    saved_qsos.extend(chunk)
+                    progress["insert"]["inserted"] += len(chunk)
+                    await report()
+            finally:
+                sync_db.close()
+
+            summary = summarize_new_qsos(spotter, saved_qsos, known_bits)
+            await record_upload_async(db, spotter, sha256, summary)
+            await report(status="done", result=summary, finished_at=func.now())
+        except (Exception, asyncio.CancelledError) as e:
+            await db.rollback()
+            await report(
+                status="failed",
+                error=str(e) or type(e).__name__,
+                finished_at=func.now(),
+            )
+            if isinstance(e, asyncio.CancelledError):
+                raise
+
+
+async def cancel_running_jobs():
+    """Cancel this process's jobs on shutdown, marking them failed."""
+    for task in running_jobs:
+        task.cancel()
+    await asyncio.gather(*running_jobs, return_exceptions=True)
+
+
+async def fail_interrupted_jobs():
+    """
+    On startup, fail the jobs a previous run of this process left queued
+    or running, since nothing will finish them.
+    """
+    async with AsyncSessionLocal() as db:
+        return await fail_unfinished_jobs_async(
+            db, JOB_HOST, "Interrupted by a server restart"
+        )
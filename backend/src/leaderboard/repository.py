@@ -0,0 +1,15 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from qsos.models import SpotterProgress
+
+
+async def get_progress_totals_async(db: AsyncSession) -> list[tuple[str, int, int]]:
+    """Get (spotter, total_areas, total_regions) for every spotter."""
+    result = await db.execute(
+        select(
+            SpotterProgress.spotter,
+            SpotterProgress.total_areas,
+            SpotterProgress.total_regions,
+        )
+    )
+    return [tuple(row) for row in result.all()]
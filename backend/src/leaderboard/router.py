@@ -0,0 +1,22 @@
+from fastapi import APIRouter, Query
+from leaderboard.schema import LeaderboardPage
+from leaderboard.service import leaderboard
+
+router = APIRouter(prefix="/leaderboard", tags=["leaderboard"])
+
+
+@router.get("", response_model=LeaderboardPage)
+async def get_leaderboard(
+    offset: int = Query(0, ge=0),
+    limit: int = Query(50, ge=1, le=100),
+):
+    """
+    Public ranking of spotters by areas and regions worked. Spotters tied
+    on both share a rank, so ranks can repeat and skip (1, 2, 2, 4).
+    """
+    return LeaderboardPage(
+        total=len(leaderboard),
+        offset=offset,
+        limit=limit,
+        entries=leaderboard.page(offset, limit),
+    )
@@ -0,0 +1,15 @@
+from pydantic import BaseModel
+
+
+class LeaderboardEntry(BaseModel):
+    rank: int
+    callsign: str
+    total_areas: int
+    total_regions: int
+
+
+class LeaderboardPage(BaseModel):
+    total: int
+    offset: int
+    limit: int
+    entries: list[LeaderboardEntry]
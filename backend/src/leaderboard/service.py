@@ -0,0 +1,87 @@
+import asyncio
+import os
+import threading
+from bisect import bisect_left, insort
+from leaderboard.schema import LeaderboardEntry
+
+# Seconds between full rebuilds from spotter_progress. Corrects drift from
+# inserts handled by other worker processes.
+LEADERBOARD_REBUILD_INTERVAL = float(os.getenv("LEADERBOARD_REBUILD_INTERVAL", "300"))
+
+
+class Leaderboard:
+    """
+    Spotters ranked by areas worked, then regions worked. Spotters tied on
+    both share a rank (1, 2, 2, 4) and are listed by callsign.
+    Kept as a sorted list of rank keys, updated in place when a spotter's
+    totals change, so reading a page only slices the list.
+    Updates may come from worker threads (inserts run in a threadpool).
+    """
+
+    def __init__(self):
+        self._keys = []  # Sorted (-total_areas, -total_regions, spotter)
+        self._key_by_spotter = {}
+        self._lock = threading.Lock()
+
+    def update(self, spotter: str, total_areas: int, total_regions: int):
+        key = (-total_areas, -total_regions, spotter)
+        with self._lock:
+            old_key = self._key_by_spotter.get(spotter)
+            if old_key == key:
+                return
+            if old_key is not None:
+                del self._keys[bisect_left(self._keys, old_key)]
+            insort(self._keys, key)
+            self._key_by_spotter[spotter] = key
+
+    def rebuild(self, totals: list[tuple[str, int, int]]):
+        keys = sorted((-areas, -regions, spotter) for spotter, areas, regions in totals)
+        with self._lock:
+            self._keys = keys
+            self._key_by_spotter = {key[2]: key for key in keys}
+
+    def page(self, offset: int, limit: int) -> list[LeaderboardEntry]:
+        with self._lock:
+            keys = self._keys[offset : offset + limit]
+            # A tie group may start on an earlier page
+            first_rank = bisect_left(self._keys, keys[0][:2]) + 1 if keys else 0
+
+        entries = []
+        rank = first_rank
+        for i, (areas, regions, spotter) in enumerate(keys):
+            if i and keys[i - 1][:2] != (areas, regions):
+                rank = offset + i + 1
+            entries.append(
+                LeaderboardEntry(
+                    rank=rank,
+                    callsign=spotter,
+                    total_areas=-areas,
+                    total_regions=-regions,
+                )
+            )
+        return entries
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+
+leaderboard = Leaderboard()
+
+
+async def rebuild_leaderboard():
+    """Rebuild the ranking from spotter_progress."""
+    from database import AsyncSessionLocal
+    from leaderboard.repository import get_progress_totals_async
+
+    async with AsyncSessionLocal() as db:
+        leaderboard.rebuild(await get_progress_totals_async(db))
+
+
+async def run_rebuild_loop(interval: float = LEADERBOARD_REBUILD_INTERVAL):
+    """Rebuild the ranking now and then periodically."""
+    while True:
+        try:
+            await rebuild_leaderboard()
+        except Exception as e:
+            print(f"Leaderboard rebuild failed: {e}")
+        await asyncio.sleep(interval)
@@ -1,7 +1,15 @@
 from contextlib import asynccontextmanager
+import asyncio
 import os
 from dotenv import load_dotenv
 from fastapi import FastAPI
+from starlette.concurrency import run_in_threadpool
+from auth import CLERK_JWT_KEY, jwks_cache
+from database import AsyncSessionLocal, warm_async_pool, warm_sync_pool
+from ingest import ingest_pool
+from jobs.service import cancel_running_jobs, fail_interrupted_jobs
+from leaderboard.service import run_rebuild_loop
+from qsos.repository import rebuild_stale_progress_async
 
 load_dotenv()
 
@@ -9,6 +17,39 @@ load_dotenv()
 # Ngrok is now handled by Docker container - see docker-compose.yml
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    # Startup logic here if needed
+    # Keep Clerk's signing keys fresh unless a static key is configured
+    jwks_refresh = None
+    if not CLERK_JWT_KEY:
+        jwks_refresh = asyncio.create_task(jwks_cache.run_refresh_loop())
+
+    # Open pooled connections before the first requests need them
+    try:
+        await asyncio.gather(run_in_threadpool(warm_sync_pool), warm_async_pool())
+    except Exception as e:
+        print(f"Database pool warm-up failed: {e}")
+
+    try:
+        await fail_interrupted_jobs()
+    except Exception as e:
+        print(f"Failing interrupted jobs failed: {e}")
+
+    # Progress written with another area bit order, before the leaderboard
+    # reads its totals
+    try:
+        async with AsyncSessionLocal() as db:
+            rebuilt = await rebuild_stale_progress_async(db)
+        if rebuilt:
+            print(f"Rebuilt spotter progress of {rebuilt} spotters")
+    except Exception as e:
+        print(f"Rebuilding spotter progress failed: {e}")
+
+    # Build the leaderboard, then rebuild it periodically to correct drift
+    leaderboard_rebuild = asyncio.create_task(run_rebuild_loop())
+
     yield
-    # Shutdown logic here if needed
+
+    leaderboard_rebuild.cancel()
+    if jwks_refresh:
+        jwks_refresh.cancel()
+    await cancel_running_jobs()
+    ingest_pool.shutdown()
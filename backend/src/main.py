@@ -1,27 +1,73 @@
+import hmac
+import json
 import uvicorn
-import adif_io
 import os
 
+from typing import Iterator, Literal
 
-from fastapi import FastAPI, UploadFile, File, Depends, HTTPException, status, Request
+from fastapi import (
+    FastAPI,
+    UploadFile,
+    File,
+    Depends,
+    HTTPException,
+    Query,
+    status,
+    Request,
+    Response,
+)
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from fastapi.security import HTTPBearer
-from adif_service import AdifService
-from database import get_db
-from qsos.repository import insert_qsos, get_areas_by_spotter
-from qsos.schema import QSO
+from adif_tokenizer import AdifParseError
+from ingest import IngestPoolFullError, extract_upload, hash_upload
+from adif_service import QSOColumns
+from database import (
+    SessionLocal,
+    get_db,
+    get_async_db,
+    get_read_db,
+    read_from_primary,
+)
+from qsos.repository import (
+    get_known_area_bits,
+    insert_qso_columns,
+    iter_insert_qso_columns,
+    record_upload,
+    get_spotter_progress_async,
+    get_upload_summary_async,
+    record_upload_async,
+)
+from qsos.schema import QSOResponse
+from qsos.service import summarize_new_qsos
+from progress import bits_to_areas, bytes_to_bits
 from users.router import router as users_router
 from qsos.router import router as qsos_router
+from leaderboard.router import router as leaderboard_router
+from jobs.router import router as jobs_router
+from jobs.service import record_duplicate_job, submit_ingest_job
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from utils import verify_clerk_session
 
 from lifespan import lifespan
+from metrics import CONTENT_TYPE, REGISTRY
+from profiles.middleware import ProfilingMiddleware
+from profiles.router import router as profiles_router
+from profiles.service import note_profile
 
 origins = [os.getenv("FRONTEND_URL", "http://localhost:5173")]
 
+# /metrics requires "Authorization: Bearer <METRICS_TOKEN>", and is disabled
+# when unset unless METRICS_PUBLIC=1 (e.g. only reachable by the scraper)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+METRICS_PUBLIC = os.getenv("METRICS_PUBLIC", "0") == "1"
+
 
 app = FastAPI(lifespan=lifespan)
 
+app.add_middleware(ProfilingMiddleware)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -33,6 +79,9 @@ app.add_middleware(
 # Include routers
 app.include_router(users_router)
 app.include_router(qsos_router)
+app.include_router(leaderboard_router)
+app.include_router(jobs_router)
+app.include_router(profiles_router)
 
 bearer_scheme = HTTPBearer()
 
@@ -45,11 +94,24 @@ def read_root():
     return {"Hello": "Worldddd"}
 
 
+@app.get("/metrics", include_in_schema=False)
+def get_metrics(request: Request):
+    """Ingest timings, counters and DB pool gauges in Prometheus text format."""
+    if METRICS_TOKEN:
+        if not hmac.compare_digest(
+            request.headers.get("Authorization", ""), f"Bearer {METRICS_TOKEN}"
+        ):
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    elif not METRICS_PUBLIC:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(REGISTRY.render(), media_type=CONTENT_TYPE)
+
+
 # get all areas of a spotter
 @app.get("/areas/{spotter_callsign}")
 async def get_all_areas(
     spotter_callsign: str,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     user_id: str = Depends(verify_clerk_session),
 ):
     # Auto-create user if doesn't exist
@@ -58,15 +120,61 @@ async def get_all_areas(
     await get_or_create_user_from_clerk(db, user_id)
 
     print(f"user_id: {user_id}")
-    areas = get_areas_by_spotter(db, spotter_callsign)
+    progress = await get_spotter_progress_async(db, spotter_callsign)
+    areas = bits_to_areas(bytes_to_bits(progress.area_bits)) if progress else []
     return {"areas": areas}
 
 
+def _qso_row(qso: QSOResponse) -> dict:
+    return {
+        "id": qso.id,
+        "date": qso.date,
+        "freq": qso.freq,
+        "dx": qso.dx,
+        "area": qso.area,
+    }
+
+
+def _stream_new_qsos(columns: QSOColumns, sha256: str) -> Iterator[str]:
+    """
+    NDJSON lines of the newly inserted QSOs, one chunk at a time as each is
+    committed, then a final line with the total.
+    Runs in the threadpool after the request's dependencies are closed,
+    so it uses its own session.
+    """
+    db = SessionLocal()
+    try:
+        known_bits = get_known_area_bits(db, columns.spotter)
+        saved_qsos = []
+        for chunk in iter_insert_qso_columns(db, columns, known_bits):
+            saved_qsos.extend(chunk)
+            yield "".join(json.dumps(_qso_row(qso)) + "\n" for qso in chunk)
+        summary = summarize_new_qsos(columns.spotter, saved_qsos, known_bits)
+        record_upload(db, columns.spotter, sha256, summary)
+        yield json.dumps(
+            {"total_qsos": summary["total_qsos"], "callsign": columns.spotter}
+        ) + "\n"
+    finally:
+        db.close()
+
+
+def _uploads_busy() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Too many uploads in progress. Please try again shortly.",
+        headers={"Retry-After": "5"},
+    )
+
+
 @app.post("/read-file")
 async def upload_file(
     request: Request,
+    response: Response,
     file: UploadFile = File(...),
-    db: Session = Depends(get_db),
+    mode: Literal["full", "summary", "stream"] = Query("full"),
+    run_async: bool = Query(False, alias="async"),
+    db: AsyncSession = Depends(get_async_db),
+    sync_db: Session = Depends(get_db),
     user_id: str = Depends(verify_clerk_session),
 ):
     # Get or create user from Clerk, then check for callsign
@@ -80,46 +188,76 @@ async def upload_file(
         )
 
     spotter_callsign = user.callsign
+    note_profile(spotter=spotter_callsign)
+
+    # An identical file was already processed: nothing new to insert, answer
+    # in the requested response shape, flagged as a duplicate
+    sha256 = await hash_upload(file)
+    summary = await get_upload_summary_async(db, spotter_callsign, sha256)
+    if summary is not None:
+        if run_async:
+            job = await record_duplicate_job(db, user, summary)
+            return JSONResponse(
+                status_code=status.HTTP_202_ACCEPTED,
+                content={"job_id": str(job.id), "status": job.status},
+            )
+        if mode == "summary":
+            return {**summary, "duplicate": True}
+        total = {"total_qsos": 0, "callsign": spotter_callsign, "duplicate": True}
+        if mode == "stream":
+            return StreamingResponse(
+                iter([json.dumps(total) + "\n"]), media_type="application/x-ndjson"
+            )
+        return {**total, "qsos": []}
 
-    contents = await file.read()
-    with open(f"temp_{file.filename}", "wb") as f:
-        f.write(contents)
-
-    qsos, header = adif_io.read_from_file(f"temp_{file.filename}")
-    adif_service = AdifService(qsos, spotter_callsign=spotter_callsign)
-    valid_entries = adif_service.get_valid_entries()
-
-    # Convert valid entries to QSO schema objects
-    qso_objects = []
-    for entry in valid_entries:
-        qso_obj = QSO(
-            date=entry.get("date", ""),
-            freq=float(entry.get("freq", 0)),
-            spotter=spotter_callsign,
-            dx=entry.get("dx", ""),
-            area=entry.get("area", ""),
+    # Process in the background and let the client poll /jobs/{id}
+    if run_async:
+        try:
+            job = await submit_ingest_job(db, user, file, sha256)
+        except IngestPoolFullError:
+            raise _uploads_busy()
+        return JSONResponse(
+            status_code=status.HTTP_202_ACCEPTED,
+            content={"job_id": str(job.id), "status": job.status},
         )
-        qso_objects.append(qso_obj)
 
-    # Save to database using functional repository
-    saved_qsos = insert_qsos(db, qso_objects)
+    # Parse and extract in the ingest process pool, segment by segment
+    try:
+        valid_columns = await extract_upload(file, spotter_callsign)
+    except IngestPoolFullError:
+        raise _uploads_busy()
+    except AdifParseError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    # Stream rows as they are inserted instead of building one payload
+    if mode == "stream":
+        stream = StreamingResponse(
+            _stream_new_qsos(valid_columns, sha256),
+            media_type="application/x-ndjson",
+        )
+        read_from_primary(stream)
+        return stream
+
+    progress = await get_spotter_progress_async(db, spotter_callsign)
+    known_bits = bytes_to_bits(progress.area_bits) if progress else 0
+
+    # Save to database straight from the columnar batch.
+    # COPY runs on the sync session, so keep it off the event loop.
+    saved_qsos = await run_in_threadpool(
+        insert_qso_columns, sync_db, valid_columns, known_bits
+    )
 
-    os.remove(f"temp_{file.filename}")
+    summary = summarize_new_qsos(spotter_callsign, saved_qsos, known_bits)
+    await record_upload_async(db, spotter_callsign, sha256, summary)
+    read_from_primary(response)
+    if mode == "summary":
+        return summary
 
     # Return organized response with QSO data
     return {
         "total_qsos": len(saved_qsos),
         "callsign": spotter_callsign,
-        "qsos": [
-            {
-                "id": qso.id,
-                "date": qso.date,
-                "freq": qso.freq,
-                "dx": qso.dx,
-                "area": qso.area,
-            }
-            for qso in saved_qsos
-        ],
+        "qsos": [_qso_row(qso) for qso in saved_qsos],
     }
 
 
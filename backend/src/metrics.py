@@ -0,0 +1,230 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+# Upper bounds in seconds, covering a cached lookup up to a very large upload
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+class Registry:
+    """Metrics rendered together in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self.metrics = []
+
+    def register(self, metric):
+        self.metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+
+def _labels(names: tuple[str, ...], values: tuple, extra: str = "") -> str:
+    pairs = [f'{name}="{value}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class _Metric(ABC):
+    type = ""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        registry: Registry = REGISTRY,
+    ):
+        self.name = name
+        self.help = help
+        self.labelnames = labelnames
+        registry.register(self)
+
+    @abstractmethod
+    def samples(self) -> Iterator[str]:
+        """Sample lines of the metric in the text exposition format."""
+
+
+class _LabeledMetric(_Metric):
+    """Metric keeping a child value per combination of label values."""
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        registry: Registry = REGISTRY,
+    ):
+        self._children = {}
+        self._lock = threading.Lock()
+        super().__init__(name, help, labelnames, registry)
+
+    def labels(self, *values):
+        """The child metric for these label values, created on first use."""
+        child = self._children.get(values)
+        if child is None:
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    @abstractmethod
+    def _new_child(self):
+        """A new child value, holding the samples of one label combination."""
+
+    def samples(self) -> Iterator[str]:
+        for values, child in list(self._children.items()):
+            yield from child.samples(self.name, self.labelnames, values)
+
+
+class _CounterValue:
+    def __init__(self):
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1):
+        with self._lock:
+            self.value += amount
+
+    def samples(self, name: str, labelnames: tuple, values: tuple) -> Iterator[str]:
+        yield f"{name}{_labels(labelnames, values)} {self.value}"
+
+
+class Counter(_LabeledMetric):
+    """Monotonically increasing count."""
+
+    type = "counter"
+
+    def _new_child(self):
+        return _CounterValue()
+
+    def inc(self, amount: float = 1):
+        self.labels().inc(amount)
+
+
+class _HistogramValue:
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # Last one is +Inf
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.sum += value
+
+    @contextmanager
+    def time(self):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def samples(self, name: str, labelnames: tuple, values: tuple) -> Iterator[str]:
+        with self._lock:
+            counts, total = list(self.counts), self.sum
+        cumulative = 0
+        for bound, count in zip((*self.buckets, "+Inf"), counts):
+            cumulative += count
+            le = f'le="{bound}"'
+            yield f"{name}_bucket{_labels(labelnames, values, le)} {cumulative}"
+        labels = _labels(labelnames, values)
+        yield f"{name}_sum{labels} {total}"
+        yield f"{name}_count{labels} {cumulative}"
+
+
+class Histogram(_LabeledMetric):
+    """Distribution of observed values, usually durations in seconds."""
+
+    type = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        registry: Registry = REGISTRY,
+    ):
+        self.buckets = buckets
+        super().__init__(name, help, labelnames, registry)
+
+    def _new_child(self):
+        return _HistogramValue(self.buckets)
+
+    def observe(self, value: float):
+        self.labels().observe(value)
+
+    def time(self):
+        return self.labels().time()
+
+
+class Gauge(_Metric):
+    """
+    Current value read at scrape time. The callback returns a mapping of
+    label values to value, e.g. {("sync",): 3}.
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        help: str,
+        labelnames: tuple[str, ...],
+        callback: Callable[[], dict[tuple, float]],
+        registry: Registry = REGISTRY,
+    ):
+        super().__init__(name, help, labelnames, registry)
+        self.callback = callback
+
+    def samples(self) -> Iterator[str]:
+        for values, value in self.callback().items():
+            yield f"{self.name}{_labels(self.labelnames, values)} {value}"
+
+
+# Upload stages: read, parse, extract and insert
+INGEST_STAGE_SECONDS = Histogram(
+    "holyland_ingest_stage_seconds",
+    "Time spent per upload in each ingest stage.",
+    ("stage",),
+)
+AUTH_VERIFY_SECONDS = Histogram(
+    "holyland_auth_verify_seconds", "Time spent verifying a Clerk session token."
+)
+USER_LOOKUP_SECONDS = Histogram(
+    "holyland_user_lookup_seconds",
+    "Time spent looking up the user of a request, from cache or database.",
+)
+QSOS_PARSED = Counter("holyland_qsos_parsed_total", "QSO records parsed from uploads.")
+AREA_HITS = Counter(
+    "holyland_area_hits_total", "Valid area entries extracted from uploads."
+)
+QSOS_INSERTED = Counter("holyland_qsos_inserted_total", "New QSO rows inserted.")
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "holyland_db_pool_checkout_seconds",
+    "Time spent waiting for a pooled connection, including opening a new one.",
+    ("engine",),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "holyland_db_pool_timeouts_total",
+    "Checkouts that gave up after DB_POOL_TIMEOUT seconds.",
+    ("engine",),
+)
@@ -0,0 +1,79 @@
+import cProfile
+import time
+from starlette.datastructures import Headers
+from database import AsyncSessionLocal
+from profiles.repository import create_profile_async
+from profiles.service import (
+    PROFILING_SECRET,
+    current_profile,
+    render_stats,
+    verify_profile_token,
+)
+
+# Header only: a query parameter would end up in access logs and referrers
+PROFILE_HEADER = "X-Profile-Token"
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests carrying a valid signed token in the X-Profile-Token
+    header, and stores the profile in request_profiles. Other requests pass
+    straight through.
+
+    cProfile can only run once per interpreter and then covers every thread,
+    so one request is profiled at a time (others overlapping with it run
+    unprofiled), and its profile includes whatever else ran meanwhile.
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self._profiling = False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not PROFILING_SECRET or self._profiling:
+            return await self.app(scope, receive, send)
+
+        token = Headers(scope=scope).get(PROFILE_HEADER)
+        if not verify_profile_token(token):
+            return await self.app(scope, receive, send)
+
+        status_code = None
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        metadata = {}
+        reset_token = current_profile.set(metadata)
+        profile = cProfile.Profile()
+        self._profiling = True
+        start = time.perf_counter()
+        profile.enable()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            profile.disable()
+            duration = time.perf_counter() - start
+            self._profiling = False
+            current_profile.reset(reset_token)
+            await self._save(scope, profile, metadata, status_code, duration)
+
+    async def _save(self, scope, profile, metadata, status_code, duration):
+        summary, raw_stats = render_stats(profile)
+        try:
+            async with AsyncSessionLocal() as db:
+                await create_profile_async(
+                    db,
+                    method=scope["method"],
+                    endpoint=scope["path"],
+                    status_code=status_code,
+                    duration=duration,
+                    spotter=metadata.get("spotter"),
+                    record_count=metadata.get("record_count"),
+                    summary=summary,
+                    stats=raw_stats,
+                )
+        except Exception as e:
+            print(f"Saving request profile failed: {e}")
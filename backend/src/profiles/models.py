@@ -0,0 +1,33 @@
+from sqlalchemy import (
+    Column,
+    Float,
+    Integer,
+    LargeBinary,
+    String,
+    DateTime,
+    Text,
+)
+from sqlalchemy.sql import func
+from database import Base
+
+
+class RequestProfile(Base):
+    """
+    cProfile data of a request an admin asked to profile,
+    see profiles/middleware.py.
+    """
+
+    __tablename__ = "request_profiles"
+
+    id = Column(Integer, primary_key=True, index=True)
+    method = Column(String, nullable=False)
+    endpoint = Column(String, nullable=False)  # Request path
+    status_code = Column(Integer, nullable=True)
+    duration = Column(Float, nullable=False)  # Seconds
+    spotter = Column(String, nullable=True)
+    record_count = Column(Integer, nullable=True)  # QSO records in the upload
+    summary = Column(Text, nullable=False)  # Top functions by cumulative time
+    stats = Column(LargeBinary, nullable=False)  # Marshalled pstats data
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
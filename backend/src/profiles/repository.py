@@ -0,0 +1,36 @@
+from typing import Optional
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import defer
+from profiles.models import RequestProfile
+
+
+async def create_profile_async(db: AsyncSession, **values) -> RequestProfile:
+    """Store a request profile"""
+    profile = RequestProfile(**values)
+    db.add(profile)
+    await db.commit()
+    return profile
+
+
+async def get_profiles_async(
+    db: AsyncSession, limit: int, spotter: Optional[str] = None
+) -> list[RequestProfile]:
+    """Latest profiles first, optionally only those of one spotter"""
+    query = (
+        select(RequestProfile)
+        .options(defer(RequestProfile.summary), defer(RequestProfile.stats))
+        .order_by(RequestProfile.id.desc())
+        .limit(limit)
+    )
+    if spotter:
+        query = query.where(RequestProfile.spotter == spotter)
+    result = await db.execute(query)
+    return list(result.scalars().all())
+
+
+async def get_profile_async(
+    db: AsyncSession, profile_id: int
+) -> Optional[RequestProfile]:
+    """Get profile by ID"""
+    return await db.get(RequestProfile, profile_id)
@@ -0,0 +1,54 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db
+from profiles.repository import get_profile_async, get_profiles_async
+from profiles.schema import RequestProfileDetail, RequestProfileResponse
+from profiles.service import verify_profile_token
+
+
+def require_profile_token(x_profile_token: str = Header("")):
+    """Admin access: the same signed token that enables profiling."""
+    if not verify_profile_token(x_profile_token):
+        raise HTTPException(status_code=403, detail="Invalid profiling token")
+
+
+router = APIRouter(
+    prefix="/admin/profiles",
+    tags=["admin"],
+    dependencies=[Depends(require_profile_token)],
+)
+
+
+@router.get("", response_model=list[RequestProfileResponse])
+async def list_profiles(
+    spotter: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    db: AsyncSession = Depends(get_async_db),
+):
+    """Latest stored request profiles."""
+    return await get_profiles_async(db, limit, spotter)
+
+
+@router.get("/{profile_id}", response_model=RequestProfileDetail)
+async def get_profile(profile_id: int, db: AsyncSession = Depends(get_async_db)):
+    """A stored profile with its top functions by cumulative time."""
+    profile = await get_profile_async(db, profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return profile
+
+
+@router.get("/{profile_id}/pstats")
+async def download_profile(profile_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Raw profile, loadable with pstats.Stats or snakeviz."""
+    profile = await get_profile_async(db, profile_id)
+    if not profile:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return Response(
+        profile.stats,
+        media_type="application/octet-stream",
+        headers={
+            "Content-Disposition": f'attachment; filename="profile-{profile_id}.pstats"'
+        },
+    )
@@ -0,0 +1,21 @@
+from pydantic import BaseModel
+from datetime import datetime
+from typing import Optional
+
+
+class RequestProfileResponse(BaseModel):
+    id: int
+    method: str
+    endpoint: str
+    status_code: Optional[int]
+    duration: float
+    spotter: Optional[str]
+    record_count: Optional[int]
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class RequestProfileDetail(RequestProfileResponse):
+    summary: str
@@ -0,0 +1,65 @@
+import cProfile
+import hashlib
+import hmac
+import io
+import marshal
+import os
+import pstats
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+# Key for signing profiling tokens. Profiling is disabled when unset.
+PROFILING_SECRET = os.getenv("PROFILING_SECRET", "")
+
+# Lines of the text summary kept with each stored profile
+PROFILE_SUMMARY_LINES = 60
+
+
+def sign_profile_token(ttl: int = 600) -> str:
+    """Token that enables profiling until `ttl` seconds from now."""
+    expires = str(int(time.time()) + ttl)
+    return f"{expires}.{_signature(expires)}"
+
+
+def verify_profile_token(token: str) -> bool:
+    if not PROFILING_SECRET or not token:
+        return False
+    expires, _, signature = token.partition(".")
+    if not expires.isdigit() or int(expires) < time.time():
+        return False
+    return hmac.compare_digest(signature, _signature(expires))
+
+
+def _signature(expires: str) -> str:
+    return hmac.new(
+        PROFILING_SECRET.encode(), f"profile:{expires}".encode(), hashlib.sha256
+    ).hexdigest()
+
+
+# Metadata of the profiled request being handled, None when not profiling
+current_profile: ContextVar[Optional[dict]] = ContextVar(
+    "current_profile", default=None
+)
+
+
+def note_profile(**metadata):
+    """Attach metadata (spotter, record count...) to the request's profile."""
+    profile = current_profile.get()
+    if profile is not None:
+        profile.update(metadata)
+
+
+def render_stats(profile: cProfile.Profile) -> tuple[str, bytes]:
+    """Text summary by cumulative time, and the raw stats for pstats.Stats."""
+    stream = io.StringIO()
+    stats = pstats.Stats(profile, stream=stream)
+    stats.sort_stats("cumulative").print_stats(PROFILE_SUMMARY_LINES)
+    return stream.getvalue(), marshal.dumps(stats.stats)
+
+
+if __name__ == "__main__":
+    import sys
+
+    # PROFILING_SECRET=... python src/profiles/service.py [ttl seconds]
+    print(sign_profile_token(int(sys.argv[1]) if len(sys.argv) > 1 else 600))
@@ -0,0 +1,53 @@
+from typing import Iterable
+from area_index import AREA_INDEX
+
+# Stable bit index of every area code, from area_bit_order.AREA_BIT_ORDER.
+# Stored bitsets depend on this order, so that list is append-only.
+AREA_CODES = AREA_INDEX["area_codes"]
+REGION_CODES = AREA_INDEX["region_codes"]
+
+AREA_BITS = AREA_INDEX["area_bits"]
+REGION_MASKS = AREA_INDEX["region_masks"]
+
+# Fingerprint of the bit order, stored with every spotter_progress row.
+# Rows with another version are rebuilt from qso_logs, see qsos.repository.
+AREA_INDEX_VERSION = AREA_INDEX["version"]
+
+# Serialized size of a bitset, enough for every area code
+BITSET_BYTES = (len(AREA_CODES) + 7) // 8
+
+
+def areas_to_bits(areas: Iterable[str]) -> int:
+    """Bitset of the given area codes. Unknown codes are ignored."""
+    bits = 0
+    for area in areas:
+        bits |= AREA_BITS.get(area, 0)
+    return bits
+
+
+def bits_to_areas(bits: int) -> list[str]:
+    """Area codes set in the bitset, in index order."""
+    areas = []
+    while bits:
+        lowest = bits & -bits
+        areas.append(AREA_CODES[lowest.bit_length() - 1])
+        bits ^= lowest
+    return areas
+
+
+def worked_regions(bits: int) -> list[str]:
+    """Regions with at least one worked area."""
+    return [region for region, mask in REGION_MASKS.items() if bits & mask]
+
+
+def new_areas(before: int, after: int) -> list[str]:
+    """Areas set in `after` but not in `before`."""
+    return bits_to_areas(after & ~before)
+
+
+def bits_to_bytes(bits: int) -> bytes:
+    return bits.to_bytes(BITSET_BYTES, "little")
+
+
+def bytes_to_bits(data: bytes) -> int:
+    return int.from_bytes(data or b"", "little")
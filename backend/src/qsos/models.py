@@ -1,13 +1,17 @@
 from sqlalchemy import (
     Boolean,
     Column,
+    Date,
     Integer,
     String,
     DateTime,
     Float,
+    Index,
+    LargeBinary,
     UniqueConstraint,
     ForeignKey,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -16,14 +20,16 @@ from database import Base
 class QSOLogs(Base):
     __tablename__ = "qso_logs"
 
-    id = Column(Integer, primary_key=True, index=True)
-    date = Column(String, index=False)  # QSO_DATE
+    id = Column(Integer, primary_key=True)
+    date = Column(String, index=False)  # QSO_DATE as uploaded (YYYYMMDD)
+    qso_date = Column(Date, nullable=True)  # QSO_DATE, None if invalid
+    qso_at = Column(
+        DateTime(timezone=True), nullable=True
+    )  # QSO_DATE + TIME_ON (UTC), None if either is missing or invalid
     freq = Column(Float, index=False)  # FREQ
-    spotter = Column(
-        String, ForeignKey("users.callsign"), index=True
-    )  # References Users.callsign
-    dx = Column(String, index=True)  # DX callsign
-    area = Column(String, index=True)  # Area or grid square
+    spotter = Column(String, ForeignKey("users.callsign"))  # References Users.callsign
+    dx = Column(String)  # DX callsign
+    area = Column(String)  # Area or grid square
     # marked_for_sticker = Column(Boolean, default=False)
     # marked_for_certificate = Column(Boolean, default=False)
     # award_id = Column(Integer, ForeignKey("awards.id"), nullable=True)
@@ -35,5 +41,57 @@ class QSOLogs(Base):
     # Relationship - many QSOs belong to one user
     user = relationship("Users", back_populates="qso_logs")
 
-    # Unique constraint on spotter + area combination
-    __table_args__ = (UniqueConstraint("spotter", "area", name="unique_spotter_area"),)
+    __table_args__ = (
+        # Unique constraint on spotter + area combination
+        UniqueConstraint("spotter", "area", name="unique_spotter_area"),
+        # Keyset pagination order, see get_qsos_page_async. The filtered
+        # variants lead with the filter column and keep the same order.
+        Index("ix_qso_logs_spotter_id", "spotter", "id"),
+        Index("ix_qso_logs_area_spotter_id", "area", "spotter", "id"),
+        Index("ix_qso_logs_dx_spotter_id", "dx", "spotter", "id"),
+        Index("ix_qso_logs_qso_date", "qso_date"),
+    )
+
+
+class SpotterProgress(Base):
+    """
+    Award progress per spotter, maintained by insert_qsos from newly
+    inserted rows so reads don't have to aggregate qso_logs.
+    """
+
+    __tablename__ = "spotter_progress"
+
+    spotter = Column(
+        String, ForeignKey("users.callsign"), primary_key=True
+    )  # References Users.callsign
+    area_bits = Column(
+        LargeBinary, nullable=False, server_default=""
+    )  # Worked areas as a bitset, see progress.py
+    total_areas = Column(Integer, nullable=False, server_default="0")
+    total_regions = Column(Integer, nullable=False, server_default="0")
+    area_index_version = Column(
+        String, nullable=True
+    )  # progress.AREA_INDEX_VERSION the bits were written with
+
+    # Timestamps
+    updated_at = Column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
+
+
+class UploadHash(Base):
+    """
+    Content hash of an upload already processed for a spotter, with its
+    result summary, so an identical re-upload is answered without parsing.
+    """
+
+    __tablename__ = "upload_hashes"
+
+    spotter = Column(
+        String, ForeignKey("users.callsign"), primary_key=True
+    )  # References Users.callsign
+    sha256 = Column(String, primary_key=True)  # Hex digest of the file
+    summary = Column(JSONB, nullable=False)  # See summarize_new_qsos
+
+    # Timestamps
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,8 +1,34 @@
+import csv
+import io
+import time
+from collections import defaultdict
+from datetime import date
+from itertools import batched
+from typing import Iterable, Iterator, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from sqlalchemy.dialects.postgresql import insert
-from sqlalchemy import select
-from qsos.models import QSOLogs
+from sqlalchemy import column, select, table, text, tuple_
+from adif_service import QSOColumns
+from leaderboard.service import leaderboard
+from metrics import INGEST_STAGE_SECONDS, QSOS_INSERTED
+from qsos.models import QSOLogs, SpotterProgress, UploadHash
 from qsos.schema import QSO, QSOResponse
+from progress import (
+    AREA_INDEX_VERSION,
+    areas_to_bits,
+    bits_to_bytes,
+    bytes_to_bits,
+    worked_regions,
+)
+
+# Rows per COPY + merge round, keeps every statement bounded in size
+COPY_CHUNK_SIZE = 20_000
+
+QSO_COLUMNS = ("date", "qso_date", "qso_at", "freq", "spotter", "dx", "area")
+
+# Per-transaction staging table the rows are streamed into with COPY
+staging_table = table("qso_logs_staging", column("seq"), *map(column, QSO_COLUMNS))
 
 
 def insert_qsos(db: Session, qsos: list[QSO]) -> list[QSOResponse]:
@@ -11,20 +37,192 @@ def insert_qsos(db: Session, qsos: list[QSO]) -> list[QSOResponse]:
     If spotter+area combination exists, do nothing.
     Returns only the newly inserted records.
     """
-    if not qsos:
-        return []
+    return _insert_rows(
+        db, (tuple(getattr(qso, name) for name in QSO_COLUMNS) for qso in qsos)
+    )
+
+
+def insert_qso_columns(
+    db: Session, columns: QSOColumns, known_bits: Optional[int] = None
+) -> list[QSOResponse]:
+    """
+    Insert a columnar batch from AdifService.get_valid_columns.
+    Rows are built straight from the columns, skipping per-row QSO validation.
+    Areas the spotter has already worked are dropped in memory first, so a
+    re-uploaded log sends (close to) nothing to the database.
+    """
+    return [
+        qso
+        for chunk in iter_insert_qso_columns(db, columns, known_bits)
+        for qso in chunk
+    ]
+
+
+def iter_insert_qso_columns(
+    db: Session, columns: QSOColumns, known_bits: Optional[int] = None
+) -> Iterator[list[QSOResponse]]:
+    """
+    Like insert_qso_columns, but yields the newly inserted records of each
+    chunk as soon as it is committed.
+    Pass `known_bits` if the spotter's worked areas were already looked up.
+    """
+    if known_bits is None:
+        known_bits = get_known_area_bits(db, columns.spotter)
+    yield from _iter_insert_rows(db, columns.first_per_area(known_bits).rows())
+
+
+def get_known_area_bits(db: Session, spotter: str) -> int:
+    """Bitset of the areas the spotter has already worked."""
+    progress = db.get(SpotterProgress, spotter)
+    if progress is None:
+        return 0
+    if _is_stale(progress):
+        # update_spotter_progress persists the rebuilt row
+        return areas_to_bits(get_areas_by_spotter(db, spotter))
+    return bytes_to_bits(progress.area_bits)
+
+
+def _is_stale(progress: SpotterProgress) -> bool:
+    """Whether the bits were written with another area bit order."""
+    return progress.area_index_version != AREA_INDEX_VERSION
 
-    # Single batch insert with conflict handling
-    stmt = insert(QSOLogs).values([qso.model_dump() for qso in qsos])
-    stmt = stmt.on_conflict_do_nothing(constraint="unique_spotter_area")
-    returning_stmt = stmt.returning(QSOLogs)  # Return only newly inserted records
 
-    result = db.execute(returning_stmt)
+def _set_progress_bits(progress: SpotterProgress, bits: int):
+    progress.area_bits = bits_to_bytes(bits)
+    progress.total_areas = bits.bit_count()
+    progress.total_regions = len(worked_regions(bits))
+    progress.area_index_version = AREA_INDEX_VERSION
+
+
+def record_upload(db: Session, spotter: str, sha256: str, summary: dict):
+    """Remember the summary of a processed upload by its content hash."""
+    db.execute(
+        insert(UploadHash)
+        .values(spotter=spotter, sha256=sha256, summary=summary)
+        .on_conflict_do_nothing()
+    )
     db.commit()
 
-    # Convert to response objects
-    newly_inserted = result.fetchall()
-    return [QSOResponse.model_validate(qso[0]) for qso in newly_inserted]
+
+def _insert_rows(db: Session, rows: Iterable[tuple]) -> list[QSOResponse]:
+    return [qso for chunk in _iter_insert_rows(db, rows) for qso in chunk]
+
+
+def _iter_insert_rows(
+    db: Session, rows: Iterable[tuple]
+) -> Iterator[list[QSOResponse]]:
+    """
+    Bulk insert rows of QSO_COLUMNS values, of any count.
+    Rows are streamed with COPY FROM STDIN into a temporary staging table in
+    chunks, and each chunk is merged into qso_logs with a single
+    INSERT ... SELECT ... ON CONFLICT DO NOTHING. The first row wins when a
+    spotter+area pair repeats.
+    Every chunk is its own transaction together with its spotter_progress
+    update, and its newly inserted records are yielded after the commit.
+    Re-running an interrupted upload only inserts what is still missing.
+    """
+    merge_stmt = (
+        insert(QSOLogs)
+        .from_select(
+            QSO_COLUMNS,
+            select(*(staging_table.c[name] for name in QSO_COLUMNS)).order_by(
+                staging_table.c.seq
+            ),
+        )
+        .on_conflict_do_nothing(constraint="unique_spotter_area")
+        .returning(QSOLogs)  # Return only newly inserted records
+    )
+
+    seq = 0
+    # Observed once per upload like the other stages, not per chunk, and
+    # without the time the caller spends between chunks
+    insert_seconds = 0.0
+    try:
+        for chunk in batched(rows, COPY_CHUNK_SIZE):
+            start = time.perf_counter()
+            db.execute(
+                text(
+                    "CREATE TEMP TABLE qso_logs_staging "
+                    "(seq integer, date varchar, qso_date date, qso_at timestamptz, "
+                    "freq float8, spotter varchar, dx varchar, area varchar) "
+                    "ON COMMIT DROP"
+                )
+            )
+            _copy_to_staging(db, chunk, seq)
+            seq += len(chunk)
+            # Convert to response objects while the rows are still loaded
+            newly_inserted = [
+                QSOResponse.model_validate(qso)
+                for qso in db.execute(merge_stmt).scalars()
+            ]
+            progress_totals = update_spotter_progress(db, newly_inserted)
+            db.commit()
+            insert_seconds += time.perf_counter() - start
+            QSOS_INSERTED.inc(len(newly_inserted))
+
+            for spotter, total_areas, total_regions in progress_totals:
+                leaderboard.update(spotter, total_areas, total_regions)
+            yield newly_inserted
+    finally:
+        INGEST_STAGE_SECONDS.labels("insert").observe(insert_seconds)
+
+
+def update_spotter_progress(
+    db: Session, new_qsos: list[QSOResponse]
+) -> list[tuple[str, int, int]]:
+    """
+    Merge newly inserted QSOs into spotter_progress.
+    Runs inside the caller's transaction; the row is locked while merging.
+    Returns the updated (spotter, total_areas, total_regions).
+    """
+    new_areas_by_spotter = defaultdict(set)
+    for qso in new_qsos:
+        new_areas_by_spotter[qso.spotter].add(qso.area)
+
+    totals = []
+    for spotter, new_areas in new_areas_by_spotter.items():
+        db.execute(
+            insert(SpotterProgress)
+            .values(spotter=spotter, area_index_version=AREA_INDEX_VERSION)
+            .on_conflict_do_nothing()
+        )
+        # populate_existing: the row may already be in the session (e.g. from
+        # get_known_area_bits) with bits since changed by another upload
+        progress = db.execute(
+            select(SpotterProgress)
+            .where(SpotterProgress.spotter == spotter)
+            .with_for_update()
+            .execution_options(populate_existing=True)
+        ).scalar_one()
+
+        if _is_stale(progress):
+            # The new QSOs are already in qso_logs
+            bits = areas_to_bits(get_areas_by_spotter(db, spotter))
+        else:
+            bits = bytes_to_bits(progress.area_bits) | areas_to_bits(new_areas)
+        _set_progress_bits(progress, bits)
+        totals.append((spotter, progress.total_areas, progress.total_regions))
+
+    return totals
+
+
+def _copy_to_staging(db: Session, rows: list[tuple], start_seq: int):
+    # QUOTE_NONNUMERIC writes None as a quoted "", which COPY reads as an
+    # empty string. FORCE_NULL turns it back into NULL for the typed columns.
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, quoting=csv.QUOTE_NONNUMERIC)
+    writer.writerows((seq, *row) for seq, row in enumerate(rows, start_seq))
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY qso_logs_staging (seq, {', '.join(QSO_COLUMNS)}) "
+            "FROM STDIN WITH (FORMAT csv, FORCE_NULL (qso_date, qso_at))",
+            buffer,
+        )
+    finally:
+        cursor.close()
 
 
 def get_all_qsos(db: Session) -> list[QSOResponse]:
@@ -45,3 +243,126 @@ def get_areas_by_spotter(db: Session, spotter: str) -> list[str]:
     result = db.execute(stmt)
     areas = result.scalars().all()
     return list(areas)
+
+
+# Async versions for routes running on the event loop.
+# Inserts stay on the sync session, since COPY goes through psycopg2.
+
+
+async def get_qsos_page_async(
+    db: AsyncSession,
+    limit: int,
+    after: Optional[tuple[str, int]] = None,
+    spotter: Optional[str] = None,
+    areas: Optional[list[str]] = None,
+    dx: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+) -> list[QSOResponse]:
+    """
+    Up to `limit` QSOs in (spotter, id) order, starting after the `after`
+    key. The date range is inclusive.
+
+    Unfiltered, or filtered by one area or dx, each page is a seek on an
+    index in that order (ix_qso_logs_spotter_id and its area/dx variants).
+    A region is a list of areas, which no index returns in keyset order:
+    every matching row is read and sorted for each page. Within a single
+    spotter that is at most one row per area (unique_spotter_area), across
+    all spotters it grows with the table.
+    """
+    stmt = select(QSOLogs).order_by(QSOLogs.spotter, QSOLogs.id).limit(limit)
+    if after is not None:
+        stmt = stmt.where(tuple_(QSOLogs.spotter, QSOLogs.id) > tuple_(*after))
+    if spotter is not None:
+        stmt = stmt.where(QSOLogs.spotter == spotter)
+    if areas is not None:
+        stmt = stmt.where(QSOLogs.area.in_(areas))
+    if dx is not None:
+        stmt = stmt.where(QSOLogs.dx == dx)
+    if date_from is not None:
+        stmt = stmt.where(QSOLogs.qso_date >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(QSOLogs.qso_date <= date_to)
+    result = await db.execute(stmt)
+    return [QSOResponse.model_validate(qso) for qso in result.scalars()]
+
+
+async def get_spotter_progress_async(
+    db: AsyncSession, spotter: str
+) -> Optional[SpotterProgress]:
+    """
+    Get the award progress of a spotter (single primary key lookup).
+    A row written with another area bit order is rebuilt from qso_logs,
+    detached so the read-only session never writes it back.
+    """
+    progress = await db.get(SpotterProgress, spotter)
+    if progress is not None and _is_stale(progress):
+        areas = await get_areas_by_spotter_async(db, spotter)
+        db.expunge(progress)
+        _set_progress_bits(progress, areas_to_bits(areas))
+    return progress
+
+
+async def rebuild_stale_progress_async(db: AsyncSession) -> int:
+    """
+    Rebuild every spotter_progress row written with another area bit order
+    (or before versions were stored) from qso_logs. Returns the row count.
+    """
+    stale = (
+        (
+            await db.execute(
+                select(SpotterProgress)
+                .where(
+                    SpotterProgress.area_index_version.is_distinct_from(
+                        AREA_INDEX_VERSION
+                    )
+                )
+                .with_for_update()
+            )
+        )
+        .scalars()
+        .all()
+    )
+    if not stale:
+        return 0
+
+    areas_by_spotter = defaultdict(list)
+    result = await db.execute(
+        select(QSOLogs.spotter, QSOLogs.area)
+        .where(QSOLogs.spotter.in_([progress.spotter for progress in stale]))
+        .distinct()
+    )
+    for spotter, area in result:
+        areas_by_spotter[spotter].append(area)
+
+    for progress in stale:
+        _set_progress_bits(progress, areas_to_bits(areas_by_spotter[progress.spotter]))
+    await db.commit()
+    return len(stale)
+
+
+async def get_areas_by_spotter_async(db: AsyncSession, spotter: str) -> list[str]:
+    """Get all areas for a specific spotter."""
+    stmt = select(QSOLogs.area).where(QSOLogs.spotter == spotter).distinct()
+    result = await db.execute(stmt)
+    return list(result.scalars().all())
+
+
+async def record_upload_async(
+    db: AsyncSession, spotter: str, sha256: str, summary: dict
+):
+    """Remember the summary of a processed upload by its content hash."""
+    await db.execute(
+        insert(UploadHash)
+        .values(spotter=spotter, sha256=sha256, summary=summary)
+        .on_conflict_do_nothing()
+    )
+    await db.commit()
+
+
+async def get_upload_summary_async(
+    db: AsyncSession, spotter: str, sha256: str
+) -> Optional[dict]:
+    """Summary of an identical upload already processed for the spotter."""
+    upload = await db.get(UploadHash, (spotter, sha256))
+    return upload.summary if upload else None
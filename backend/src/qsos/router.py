@@ -1,35 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from database import get_db
-from utils import verify_clerk_session
-from users.repository import get_user_by_clerk_id
-from qsos.repository import get_areas_by_spotter
-from qsos.service import get_regions_from_areas
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_read_db
+from utils import is_admin, verify_clerk_session
+from users.service import get_cached_user_by_clerk_id
+from qsos.repository import get_qsos_page_async, get_spotter_progress_async
+from qsos.schema import QSOPage
+from qsos.service import decode_cursor, encode_cursor, filter_areas
+from progress import bits_to_areas, bytes_to_bits, worked_regions
 
 router = APIRouter(prefix="/qsos", tags=["qsos"])
 
 
 @router.get("/by-user")
-def get_user_areas_and_regions(
-    db: Session = Depends(get_db),
+async def get_user_areas_and_regions(
+    db: AsyncSession = Depends(get_read_db),
     user_id: str = Depends(verify_clerk_session),
 ):
     """
     Get the current user's areas and regions based on their QSO logs.
     """
     # Get user by Clerk ID to retrieve callsign
-    user = get_user_by_clerk_id(db, user_id)
+    user = await get_cached_user_by_clerk_id(db, user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     if not user.callsign:
         raise HTTPException(status_code=400, detail="User has no callsign assigned")
 
-    # Get all areas for this user's callsign
-    areas = get_areas_by_spotter(db, user.callsign)
-
-    # Extract unique regions from areas
-    regions = get_regions_from_areas(areas)
+    # Precomputed progress, maintained on every insert
+    progress = await get_spotter_progress_async(db, user.callsign)
+    bits = bytes_to_bits(progress.area_bits) if progress else 0
+    areas = bits_to_areas(bits)
+    regions = worked_regions(bits)
 
     return {
         "callsign": user.callsign,
@@ -38,3 +42,61 @@ def get_user_areas_and_regions(
         "total_areas": len(areas),
         "total_regions": len(regions),
     }
+
+
+@router.get("", response_model=QSOPage)
+async def list_qsos(
+    spotter: Optional[str] = None,
+    area: Optional[str] = None,
+    region: Optional[str] = None,
+    dx: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    cursor: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_read_db),
+    user_id: str = Depends(verify_clerk_session),
+    admin: bool = Depends(is_admin),
+):
+    """
+    QSOs ordered by spotter then id, one page at a time. Follow next_cursor
+    for the next page; filters must stay the same between pages.
+    Lists the caller's own QSOs. Other spotters' (or every spotter's, when
+    `spotter` is omitted) need the X-Admin-Token header (ADMIN_TOKEN).
+    """
+    if not admin:
+        user = await get_cached_user_by_clerk_id(db, user_id)
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        if not user.callsign:
+            raise HTTPException(status_code=400, detail="User has no callsign assigned")
+        if spotter is None:
+            spotter = user.callsign
+        elif spotter != user.callsign:
+            raise HTTPException(
+                status_code=403, detail="Listing other spotters' QSOs is admin only"
+            )
+
+    try:
+        after = decode_cursor(cursor) if cursor else None
+        areas = filter_areas(area, region)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    # One extra row tells whether there is a next page
+    qsos = await get_qsos_page_async(
+        db,
+        limit + 1,
+        after=after,
+        spotter=spotter,
+        areas=areas,
+        dx=dx,
+        date_from=date_from,
+        date_to=date_to,
+    )
+    entries = qsos[:limit]
+    return QSOPage(
+        limit=limit,
+        next_cursor=encode_cursor(entries[-1]) if len(qsos) > limit else None,
+        entries=entries,
+    )
@@ -1,10 +1,12 @@
 from pydantic import BaseModel
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 
 class QSO(BaseModel):
     date: str
+    qso_date: Optional[date] = None
+    qso_at: Optional[datetime] = None
     freq: float
     spotter: str
     dx: str
@@ -20,3 +22,10 @@ class QSOResponse(QSO):
 
     class Config:
         from_attributes = True  # Allows Pydantic to work with SQLAlchemy models
+
+
+class QSOPage(BaseModel):
+    limit: int
+    # Pass as ?cursor= to get the next page, None on the last page
+    next_cursor: Optional[str]
+    entries: list[QSOResponse]
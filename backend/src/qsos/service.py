@@ -1,12 +1,57 @@
-def get_regions_from_areas(areas: list[str]) -> list[str]:
+import base64
+import json
+from typing import Optional
+from area_index import AREA_INDEX
+from progress import areas_to_bits, new_areas, worked_regions
+from qsos.schema import QSOResponse
+
+
+def summarize_new_qsos(
+    callsign: str, new_qsos: list[QSOResponse], known_bits: int
+) -> dict:
     """
-    Extract unique regions from a list of areas.
-    The region is the last 2 characters of each area.
+    Counts and newly worked area/region codes of an upload.
+    `known_bits` is the spotter's area bitset from before the upload.
     """
-    regions = set()
-    for area in areas:
-        if len(area) >= 2:
-            region = area[-2:]  # Last 2 characters
-            regions.add(region)
+    bits = known_bits | areas_to_bits(qso.area for qso in new_qsos)
+    known_regions = worked_regions(known_bits)
+    return {
+        "total_qsos": len(new_qsos),
+        "callsign": callsign,
+        "new_areas": new_areas(known_bits, bits),
+        "new_regions": [
+            region for region in worked_regions(bits) if region not in known_regions
+        ],
+    }
+
+
+def encode_cursor(qso: QSOResponse) -> str:
+    """Opaque cursor for the page after `qso`, see get_qsos_page_async."""
+    key = json.dumps([qso.spotter, qso.id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
 
-    return list(regions)
+def decode_cursor(cursor: str) -> tuple[str, int]:
+    """The (spotter, id) key of a cursor. Raises ValueError if malformed."""
+    try:
+        spotter, qso_id = json.loads(
+            base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        )
+    except (TypeError, ValueError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(spotter, str) or not isinstance(qso_id, int):
+        raise ValueError("Invalid cursor")
+    return spotter, qso_id
+
+
+def filter_areas(area: Optional[str], region: Optional[str]) -> Optional[list[str]]:
+    """
+    Area codes matching the area and/or region filters, None for no filter.
+    Raises ValueError for an unknown region.
+    """
+    if region is None:
+        return None if area is None else [area]
+    if region not in AREA_INDEX["areas"]:
+        raise ValueError(f"Unknown region {region}")
+    areas = list(AREA_INDEX["areas"][region])
+    return areas if area is None else [a for a in areas if a == area]
@@ -1,3 +1,6 @@
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from users.models import Users
 from typing import Optional
@@ -52,3 +55,63 @@ def update_user_profile(
         db.commit()
         db.refresh(user)
     return user
+
+
+# Async versions for routes running on the event loop
+
+
+async def create_user_async(
+    db: AsyncSession, clerk_user_id: str, email: str, username: Optional[str] = None
+) -> Users:
+    """
+    Create a new user with null callsign.
+    Uses INSERT ... ON CONFLICT (clerk_user_id) DO NOTHING, so a concurrent
+    creation of the same user returns the existing row instead of failing.
+    """
+    stmt = (
+        insert(Users)
+        .values(
+            clerk_user_id=clerk_user_id,
+            email=email,
+            username=username,
+            callsign=None,  # Will be set later when user provides it
+        )
+        .on_conflict_do_nothing(index_elements=["clerk_user_id"])
+        .returning(Users)
+    )
+    user = await db.scalar(stmt)
+    await db.commit()
+    if user is None:
+        user = await get_user_by_clerk_id_async(db, clerk_user_id)
+    return user
+
+
+async def get_user_by_clerk_id_async(
+    db: AsyncSession, clerk_user_id: str
+) -> Optional[Users]:
+    """Get user by Clerk user ID"""
+    result = await db.execute(
+        select(Users).where(Users.clerk_user_id == clerk_user_id).limit(1)
+    )
+    return result.scalars().first()
+
+
+async def get_user_by_callsign_async(
+    db: AsyncSession, callsign: str
+) -> Optional[Users]:
+    """Get user by callsign"""
+    result = await db.execute(select(Users).where(Users.callsign == callsign).limit(1))
+    return result.scalars().first()
+
+
+async def update_user_profile_async(
+    db: AsyncSession, clerk_user_id: str, callsign: str, region: int
+) -> Optional[Users]:
+    """Update user's callsign and region"""
+    user = await get_user_by_clerk_id_async(db, clerk_user_id)
+    if user:
+        user.callsign = callsign
+        user.region = region
+        await db.commit()
+        await db.refresh(user)
+    return user
@@ -1,10 +1,10 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from users import service as user_service
 from utils import verify_clerk_session
 from users.schema import UserProfileUpdateRequest, UserResponse
 
-from database import get_db
-from sqlalchemy.orm import Session
+from database import get_async_db, get_read_db, read_from_primary
+from sqlalchemy.ext.asyncio import AsyncSession
 
 
 router = APIRouter(prefix="/user")
@@ -12,7 +12,8 @@ router = APIRouter(prefix="/user")
 
 @router.get("/callsign")
 async def get_user_callsign(
-    db: Session = Depends(get_db), user_id: str = Depends(verify_clerk_session)
+    db: AsyncSession = Depends(get_read_db),
+    user_id: str = Depends(verify_clerk_session),
 ):
     # Auto-create user if doesn't exist
     from utils import get_or_create_user_from_clerk
@@ -23,7 +24,7 @@ async def get_user_callsign(
 
 @router.get("/profile", response_model=UserResponse)
 async def get_user_profile(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(verify_clerk_session),
 ):
     """Get current user's profile (auto-creates user on first request)"""
@@ -46,7 +47,8 @@ async def get_user_profile(
 @router.patch("/profile", response_model=UserResponse)
 async def update_user_profile(
     profile_data: UserProfileUpdateRequest,
-    db: Session = Depends(get_db),
+    response: Response,
+    db: AsyncSession = Depends(get_async_db),
     user_id: str = Depends(verify_clerk_session),
 ):
     """Update user's callsign and region (auto-creates user if needed)"""
@@ -57,7 +59,7 @@ async def update_user_profile(
         await get_or_create_user_from_clerk(db, user_id)
 
         # Update user profile using the service function
-        updated_user = user_service.update_user_profile(
+        updated_user = await user_service.update_user_profile_async(
             db=db,
             clerk_user_id=user_id,
             callsign=profile_data.callsign,
@@ -69,6 +71,7 @@ async def update_user_profile(
                 status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
             )
 
+        read_from_primary(response)
         return UserResponse.from_orm(updated_user)
 
     except ValueError as e:
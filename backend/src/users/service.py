@@ -1,13 +1,49 @@
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from users.repository import (
     create_user,
     get_user_by_clerk_id,
     get_user_by_callsign,
+    get_user_by_clerk_id_async,
+    get_user_by_callsign_async,
     update_user_callsign as repo_update_user_callsign,
     update_user_profile as repo_update_user_profile,
+    update_user_profile_async as repo_update_user_profile_async,
 )
 from users.models import Users
+from users.schema import UserResponse
+from cache import TTLCache
+from metrics import USER_LOOKUP_SECONDS
 from typing import Optional, Dict, Any
+import os
+
+# Users by Clerk ID for the authenticated hot paths. Per process: updates made
+# through another worker become visible here after at most USER_CACHE_TTL.
+user_cache = TTLCache(
+    maxsize=int(os.getenv("USER_CACHE_SIZE", "10000")),
+    ttl=float(os.getenv("USER_CACHE_TTL", "60")),
+)
+
+
+async def get_cached_user_by_clerk_id(
+    db: AsyncSession, clerk_user_id: str
+) -> Optional[UserResponse]:
+    """Get user by Clerk user ID, served from user_cache when possible"""
+    with USER_LOOKUP_SECONDS.time():
+        user = user_cache.get(clerk_user_id)
+        if user is None:
+            db_user = await get_user_by_clerk_id_async(db, clerk_user_id)
+            if db_user is None:
+                return None
+            user = cache_user(db_user)
+        return user
+
+
+def cache_user(db_user: Users) -> UserResponse:
+    """Store a snapshot of the user in user_cache and return it"""
+    user = UserResponse.model_validate(db_user)
+    user_cache.set(user.clerk_user_id, user)
+    return user
 
 
 def handle_clerk_user_created(db: Session, webhook_data: Dict[str, Any]) -> Users:
@@ -55,7 +91,9 @@ def update_user_callsign(
     if existing_user and existing_user.clerk_user_id != clerk_user_id:
         raise ValueError(f"Callsign {callsign} is already taken")
 
-    return repo_update_user_callsign(db, clerk_user_id, callsign)
+    user = repo_update_user_callsign(db, clerk_user_id, callsign)
+    user_cache.pop(clerk_user_id)
+    return user
 
 
 def update_user_profile(
@@ -71,7 +109,9 @@ def update_user_profile(
     if existing_user and existing_user.clerk_user_id != clerk_user_id:
         raise ValueError(f"Callsign {callsign} is already taken")
 
-    return repo_update_user_profile(db, clerk_user_id, callsign, region)
+    user = repo_update_user_profile(db, clerk_user_id, callsign, region)
+    user_cache.pop(clerk_user_id)
+    return user
 
 
 def get_user_callsign(db: Session, clerk_user_id: str) -> Optional[str]:
@@ -80,3 +120,21 @@ def get_user_callsign(db: Session, clerk_user_id: str) -> Optional[str]:
     if user:
         return user.callsign
     return None
+
+
+async def update_user_profile_async(
+    db: AsyncSession, clerk_user_id: str, callsign: str, region: int
+) -> Optional[Users]:
+    """Update user's callsign and region"""
+    # Validate region (0 = Israel, 1-3 = IARU regions)
+    if region not in [0, 1, 2, 3]:
+        raise ValueError("Region must be 0 (Israel), 1, 2, or 3")
+
+    # Check if callsign is already taken
+    existing_user = await get_user_by_callsign_async(db, callsign)
+    if existing_user and existing_user.clerk_user_id != clerk_user_id:
+        raise ValueError(f"Callsign {callsign} is already taken")
+
+    user = await repo_update_user_profile_async(db, clerk_user_id, callsign, region)
+    user_cache.pop(clerk_user_id)
+    return user
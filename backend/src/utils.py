@@ -1,108 +1,132 @@
-from clerk_backend_api import Clerk
-from clerk_backend_api.security.types import AuthenticateRequestOptions
-from fastapi import Request, HTTPException, status
-from sqlalchemy.orm import Session
+from auth import get_session_token, session_verifier
+from metrics import AUTH_VERIFY_SECONDS
+from fastapi import Header, Request, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from dotenv import load_dotenv
+from typing import Optional
+import asyncio
+import functools
+import hmac
 import os
 
 load_dotenv()
 
-clerk = Clerk(bearer_auth=os.getenv("CLERK_SECRET_KEY", ""))
+# Admin access to other spotters' data, sent as X-Admin-Token (off when unset)
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
 
 
-async def get_or_create_user_from_clerk(db: Session, clerk_user_id: str):
+def is_admin(x_admin_token: str = Header("")) -> bool:
+    """Whether the request carries ADMIN_TOKEN in the X-Admin-Token header."""
+    return bool(ADMIN_TOKEN) and hmac.compare_digest(
+        x_admin_token.encode(), ADMIN_TOKEN.encode()
+    )
+
+
+@functools.cache
+def get_clerk():
+    """Clerk API client, created on first use since the SDK is slow to import."""
+    from clerk_backend_api import Clerk
+
+    return Clerk(bearer_auth=os.getenv("CLERK_SECRET_KEY", ""))
+
+
+# In-flight user creations by Clerk ID. Concurrent first requests for a new
+# user await the same task, so Clerk is called and the row written once.
+pending_user_creations: dict[str, asyncio.Task] = {}
+
+
+async def get_or_create_user_from_clerk(db: AsyncSession, clerk_user_id: str):
     """
     Get existing user or create new user from Clerk data.
     This eliminates the need for webhooks - users are created on first authentication.
     """
-    from users.repository import get_user_by_clerk_id, create_user
+    from users.service import get_cached_user_by_clerk_id
 
     # Check if user already exists
-    existing_user = get_user_by_clerk_id(db, clerk_user_id)
+    existing_user = await get_cached_user_by_clerk_id(db, clerk_user_id)
     if existing_user:
         return existing_user
 
-    # User doesn't exist - fetch details from Clerk and create
-    try:
-        clerk_user = clerk.users.get(user_id=clerk_user_id)
-
-        if not clerk_user:
-            # Fallback: create user with minimal info
-            return create_user(
-                db=db,
-                clerk_user_id=clerk_user_id,
-                email=f"{clerk_user_id}@unknown.clerk",  # Placeholder email
-                username=None,
-            )
-
-        # Extract email safely
-        email = f"{clerk_user_id}@unknown.clerk"  # Default fallback
-        if hasattr(clerk_user, "email_addresses") and clerk_user.email_addresses:
-            # Try to find primary email
-            for email_addr in clerk_user.email_addresses:
-                if hasattr(email_addr, "id") and hasattr(
-                    clerk_user, "primary_email_address_id"
-                ):
-                    if email_addr.id == clerk_user.primary_email_address_id:
-                        email = email_addr.email_address
-                        break
-            # Fallback to first email if primary not found
-            if email == f"{clerk_user_id}@unknown.clerk" and clerk_user.email_addresses:
-                first_email = clerk_user.email_addresses[0]
-                if hasattr(first_email, "email_address"):
-                    email = first_email.email_address
-
-        # Get username safely
-        username = clerk_user.username if hasattr(clerk_user, "username") else None
-
-        # Create user
-        return create_user(
+    # User doesn't exist - fetch details from Clerk and create (single-flight)
+    creation = pending_user_creations.get(clerk_user_id)
+    if creation is None:
+        creation = asyncio.create_task(create_user_from_clerk(clerk_user_id))
+        pending_user_creations[clerk_user_id] = creation
+        creation.add_done_callback(
+            lambda _: pending_user_creations.pop(clerk_user_id, None)
+        )
+    # Shielded so a cancelled request doesn't cancel the others' creation
+    return await asyncio.shield(creation)
+
+
+async def create_user_from_clerk(clerk_user_id: str):
+    """
+    Fetch the user's details from Clerk and create the user record.
+    Uses its own session, since it may outlive the request that started it.
+    """
+    from database import AsyncSessionLocal
+    from users.repository import create_user_async
+    from users.service import cache_user
+
+    email, username = await fetch_clerk_user_details(clerk_user_id)
+    async with AsyncSessionLocal() as db:
+        user = await create_user_async(
             db=db, clerk_user_id=clerk_user_id, email=email, username=username
         )
+    return cache_user(user)
+
+
+async def fetch_clerk_user_details(clerk_user_id: str) -> tuple[str, Optional[str]]:
+    """
+    Get the user's primary email and username from Clerk.
+    Falls back to a placeholder email if Clerk has no data or can't be reached.
+    """
+    email = f"{clerk_user_id}@unknown.clerk"  # Default fallback
+    try:
+        clerk_user = await get_clerk().users.get_async(user_id=clerk_user_id)
     except Exception as e:
-        print(f"Error creating user from Clerk data: {e}")
-        # Create minimal user record if Clerk fetch fails
-        return create_user(
-            db=db,
-            clerk_user_id=clerk_user_id,
-            email=f"{clerk_user_id}@unknown.clerk",
-            username=None,
-        )
+        print(f"Error fetching user from Clerk: {e}")
+        return email, None
+
+    if not clerk_user:
+        return email, None
+
+    if hasattr(clerk_user, "email_addresses") and clerk_user.email_addresses:
+        # Try to find primary email
+        for email_addr in clerk_user.email_addresses:
+            if hasattr(email_addr, "id") and hasattr(
+                clerk_user, "primary_email_address_id"
+            ):
+                if email_addr.id == clerk_user.primary_email_address_id:
+                    email = email_addr.email_address
+                    break
+        # Fallback to first email if primary not found
+        if email == f"{clerk_user_id}@unknown.clerk" and clerk_user.email_addresses:
+            first_email = clerk_user.email_addresses[0]
+            if hasattr(first_email, "email_address"):
+                email = first_email.email_address
+
+    # Get username safely
+    username = clerk_user.username if hasattr(clerk_user, "username") else None
+    return email, username
 
 
 # Define the authentication dependency
 async def verify_clerk_session(request: Request):
     """
-    Verifies the user's session using Clerk's SDK and returns the user ID.
+    Verifies the user's session JWT locally against Clerk's cached JWKS and
+    returns the user ID.
     Raises an HTTPException if the user is not authenticated.
     """
-    try:
-        # Pass the raw FastAPI request object to Clerk's authentication method.
-        # This handles parsing the Authorization header and verifying the JWT.
-        frontend_url = os.getenv("FRONTEND_URL", "http://localhost:5173")
-
-        session = clerk.authenticate_request(
-            request,
-            AuthenticateRequestOptions(authorized_parties=[frontend_url]),
+    token = get_session_token(request)
+    if not token:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated."
         )
 
-        # The session object contains all the user and session data
-        if not session.is_signed_in:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED, detail="Not authenticated."
-            )
-
-        # Return the user_id, which can be injected into the route handler
-        user_id = session.payload.get("sub") if session.payload else None
-        if not user_id:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid session."
-            )
-        return user_id
-
-    except HTTPException:
-        # Re-raise HTTP exceptions as-is
-        raise
+    try:
+        with AUTH_VERIFY_SECONDS.time():
+            return await session_verifier.verify(token)
     except Exception as e:
         # Catch any exceptions during authentication and return a 401 error
         print(f"Authentication failed: {e}")
@@ -0,0 +1,62 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+
+
+@pytest.fixture
+def sync_db():
+    """
+    Session on DATABASE_URL, skipping the test when no database is reachable.
+    Tests using it must clean up the rows they create.
+    """
+    from sqlalchemy import text
+    from sqlalchemy.exc import OperationalError
+    from database import SessionLocal
+    from users.models import Users  # noqa: F401, needed by the QSOLogs mapper
+
+    db = SessionLocal()
+    try:
+        db.execute(text("SELECT 1"))
+    except OperationalError:
+        db.close()
+        pytest.skip("no database at DATABASE_URL")
+    try:
+        yield db
+    finally:
+        db.rollback()
+        db.close()
+
+
+@pytest.fixture
+def spotter(request, sync_db):
+    """
+    The SPOTTER callsign defined by the test module, as a fresh user with no
+    QSOs or progress. Its rows are deleted again afterwards.
+    """
+    from sqlalchemy import text
+
+    callsign = request.module.SPOTTER
+
+    def clean():
+        for table in ("qso_logs", "spotter_progress"):
+            sync_db.execute(
+                text(f"DELETE FROM {table} WHERE spotter = :spotter"),
+                {"spotter": callsign},
+            )
+        sync_db.execute(
+            text("DELETE FROM users WHERE callsign = :spotter"), {"spotter": callsign}
+        )
+        sync_db.commit()
+
+    clean()
+    sync_db.execute(
+        text("INSERT INTO users (clerk_user_id, callsign) VALUES (:id, :spotter)"),
+        {"id": f"test-{callsign}", "spotter": callsign},
+    )
+    sync_db.commit()
+    yield callsign
+    sync_db.rollback()
+    clean()
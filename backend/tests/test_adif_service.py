@@ -0,0 +1,42 @@
+from array import array
+from adif_service import QSOColumns
+from progress import areas_to_bits
+
+
+def _columns(*areas: str) -> QSOColumns:
+    return QSOColumns(
+        spotter="TEST0COL",
+        date=[f"2025010{i + 1}" for i in range(len(areas))],
+        qso_date=[f"2025-01-0{i + 1}" for i in range(len(areas))],
+        qso_at=[None] * len(areas),
+        freq=array("d", [float(i) for i in range(len(areas))]),
+        dx=[f"4X{i}AA" for i in range(len(areas))],
+        area=list(areas),
+    )
+
+
+def test_first_per_area_keeps_first_occurrence():
+    result = _columns("H03AK", "B21AS", "H03AK", "N05KT", "B21AS").first_per_area()
+    assert result.area == ["H03AK", "B21AS", "N05KT"]
+    assert result.dx == ["4X0AA", "4X1AA", "4X3AA"]
+    assert result.date == ["20250101", "20250102", "20250104"]
+    assert list(result.freq) == [0.0, 1.0, 3.0]
+    assert result.spotter == "TEST0COL"
+
+
+def test_first_per_area_drops_known_areas():
+    columns = _columns("H03AK", "B21AS", "N05KT", "H03AK")
+    result = columns.first_per_area(areas_to_bits(["H03AK", "N05KT"]))
+    assert result.area == ["B21AS"]
+    assert result.dx == ["4X1AA"]
+
+
+def test_first_per_area_all_known_or_empty():
+    columns = _columns("H03AK", "B21AS")
+    assert len(columns.first_per_area(areas_to_bits(columns.area))) == 0
+    assert len(_columns().first_per_area()) == 0
+
+
+def test_rows_follow_qso_columns():
+    [row] = _columns("H03AK").rows()
+    assert row == ("20250101", "2025-01-01", None, 0.0, "TEST0COL", "4X0AA", "H03AK")
@@ -0,0 +1,70 @@
+import pytest
+from adif_tokenizer import (
+    MAX_FIELD_LENGTH,
+    AdifParseError,
+    AdifRecord,
+    AdifTokenizer,
+    tokenize_adif,
+)
+
+
+def _field(name: str, value: bytes) -> bytes:
+    return f"<{name}:{len(value)}>".encode() + value
+
+
+def test_record_split_across_chunks():
+    data = b"header<EOH>" + _field("CALL", b"4X1AA") + _field("COMMENT", b"a<b>c")
+    data += b"<EOR>"
+    tokenizer = AdifTokenizer()
+    records = [record for byte in data for record in tokenizer.feed(bytes([byte]))]
+    assert [(r.call, r.comment) for r in records] == [("4X1AA", "a<b>c")]
+
+
+def _log(*comments: bytes) -> bytes:
+    data = b"<ADIF_VER:5>3.1.4 <EOH>\n"
+    for i, comment in enumerate(comments):
+        data += _field("CALL", f"4X{i}AA".encode()) + b" "
+        data += _field("comment", comment) + b" <eor>\n"
+    return data
+
+
+@pytest.mark.parametrize(
+    "comments",
+    [
+        [b"plain", b"", b"two words"],
+        [b"a<b", b"plain"],  # '<' in a value: the fast path steps aside
+        [b"<EOR>", b"see <CALL:5>ZZZZZ"],  # tags inside values
+        [b"x" * 1000, "שלום".encode()],
+    ],
+)
+def test_fast_path_matches_tag_by_tag(comments):
+    data = _log(*comments)
+    expected = [
+        AdifRecord(call=f"4X{i}AA", comment=comment.decode().strip())
+        for i, comment in enumerate(comments)
+    ]
+    assert tokenize_adif(data) == expected
+    # Fed byte by byte, so every record completes across many chunks
+    tokenizer = AdifTokenizer()
+    assert [r for byte in data for r in tokenizer.feed(bytes([byte]))] == expected
+    # Split mid-record, both paths share one record's fields
+    tokenizer = AdifTokenizer()
+    middle = len(data) // 2
+    assert tokenizer.feed(data[:middle]) + tokenizer.feed(data[middle:]) == expected
+
+
+def test_field_at_the_limit_is_accepted():
+    value = b"x" * MAX_FIELD_LENGTH
+    [record] = tokenize_adif(_field("COMMENT", value) + b"<EOR>")
+    assert record.comment == value.decode()
+
+
+@pytest.mark.parametrize("length", [MAX_FIELD_LENGTH + 1, 10**9, "9" * 5000])
+def test_declared_length_over_the_limit_is_rejected(length):
+    tokenizer = AdifTokenizer()
+    with pytest.raises(AdifParseError, match="COMMENT"):
+        # Nothing follows the tag: rejected before waiting for the value
+        tokenizer.feed(f"<CALL:5>4X1AA<COMMENT:{length}>".encode())
+    # Same when a complete record follows, through the fast path
+    with pytest.raises(AdifParseError, match="COMMENT"):
+        tokenize_adif(f"<COMMENT:{length}>x <EOR>".encode())
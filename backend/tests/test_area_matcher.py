@@ -0,0 +1,67 @@
+import pytest
+from adif_service import AdifService
+from adif_tokenizer import AdifRecord
+from area_index import AREA_INDEX
+from area_matcher import AREA_MATCHER, AreaMatcher
+
+AREA_CODES = [area for codes in AREA_INDEX["areas"].values() for area in codes]
+
+# Field values around the area codes, as they show up in real logs
+EDGE_CASES = [
+    "",
+    " ",
+    "H03AK",
+    "h03ak",
+    "H03ak",
+    " H03AK ",
+    "H03AK/P",
+    "4X/H03AK",
+    "H03-AK",
+    "H03.AK",
+    "H03AK,B21AS",
+    "H03AK B21AS",
+    "59 001 H03AK",
+    "QSO from H03AK, tnx",
+    "H03AKX",
+    "XH03AK",
+    "H03A",
+    "H03ZZ",
+    "Z99AK",
+    "H03AK\tB21AS",
+    "H03AK\nB21AS",
+    "HO3AK",
+    "H 03AK",
+    "JN38AK",
+    "תל אביב H03AK",
+    "B21AS H03AK",
+]
+
+_legacy = AdifService([], "TEST0AREA")
+
+
+def _legacy_areas(stx: str, srx: str, comment: str) -> list[str]:
+    record = AdifRecord(stx_string=stx, srx_string=srx, comment=comment)
+    return _legacy._get_areas(record)
+
+
+@pytest.mark.parametrize("area", AREA_CODES)
+def test_every_area_matches_legacy(area):
+    for stx, srx, comment in (
+        (area, "", ""),
+        ("", area, ""),
+        ("", "", f"worked {area} tnx"),
+        ("59", f"599 {area}", area.lower()),
+    ):
+        assert AREA_MATCHER.find_areas(stx, srx, comment) == _legacy_areas(
+            stx, srx, comment
+        )
+
+
+@pytest.mark.parametrize("value", EDGE_CASES)
+def test_edge_cases_match_legacy(value):
+    # A fresh matcher, so results don't come from the shared memo
+    matcher = AreaMatcher(AREA_INDEX["areas"])
+    for fields in ((value, "", ""), ("", value, ""), ("", "", value)):
+        assert matcher.find_areas(*fields) == _legacy_areas(*fields)
+    # Second lookup is served from the memo and must agree as well
+    assert matcher.find_areas(value, value, value) == _legacy_areas(value, value, value)
@@ -0,0 +1,100 @@
+import asyncio
+import json
+import time
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives.asymmetric import rsa
+from auth import JWKS_MIN_REFRESH_INTERVAL, JWKSCache, SessionVerifier
+
+AUDIENCE = "http://localhost:5173"
+
+
+def _key_pair(kid: str) -> tuple:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    return private_key, {**jwk, "kid": kid, "alg": "RS256", "use": "sig"}
+
+
+FIRST_KEY, FIRST_JWK = _key_pair("first")
+SECOND_KEY, SECOND_JWK = _key_pair("second")
+
+
+class LocalJWKSCache(JWKSCache):
+    """Serves `served` instead of fetching Clerk's JWKS endpoint."""
+
+    def __init__(self, *jwks: dict):
+        super().__init__(url="", headers={}, ttl=3600)
+        self.served = list(jwks)
+        self.fetches = 0
+
+    async def _fetch(self) -> dict:
+        self.fetches += 1
+        return {"keys": self.served}
+
+
+def _token(private_key, kid: str, expires_in: int = 60, **claims) -> str:
+    now = int(time.time())
+    payload = {"sub": "user_1", "iat": now, "exp": now + expires_in, **claims}
+    return jwt.encode(payload, private_key, algorithm="RS256", headers={"kid": kid})
+
+
+def _verify(jwks: JWKSCache, token: str) -> str:
+    return asyncio.run(SessionVerifier(jwks, [AUDIENCE]).verify(token))
+
+
+def test_valid_token():
+    jwks = LocalJWKSCache(FIRST_JWK)
+    token = _token(FIRST_KEY, "first", azp=AUDIENCE)
+    assert _verify(jwks, token) == "user_1"
+    assert jwks.fetches == 1
+
+
+def test_expired_token():
+    jwks = LocalJWKSCache(FIRST_JWK)
+    with pytest.raises(jwt.ExpiredSignatureError):
+        _verify(jwks, _token(FIRST_KEY, "first", expires_in=-60))
+
+
+def test_unknown_kid():
+    jwks = LocalJWKSCache(FIRST_JWK)
+    with pytest.raises(jwt.InvalidTokenError, match="Unknown signing key"):
+        _verify(jwks, _token(SECOND_KEY, "second"))
+
+
+def test_wrong_key_for_kid():
+    jwks = LocalJWKSCache(FIRST_JWK)
+    with pytest.raises(jwt.InvalidSignatureError):
+        _verify(jwks, _token(SECOND_KEY, "first"))
+
+
+def test_unauthorized_party():
+    jwks = LocalJWKSCache(FIRST_JWK)
+    with pytest.raises(jwt.InvalidTokenError, match="Unauthorized party"):
+        _verify(jwks, _token(FIRST_KEY, "first", azp="https://evil.example"))
+
+
+def test_key_rotation():
+    jwks = LocalJWKSCache(FIRST_JWK)
+    assert _verify(jwks, _token(FIRST_KEY, "first")) == "user_1"
+
+    # Clerk rotates to a new key after the last fetch
+    jwks.served = [SECOND_JWK]
+    jwks._fetched_at -= JWKS_MIN_REFRESH_INTERVAL + 1
+    assert _verify(jwks, _token(SECOND_KEY, "second")) == "user_1"
+    assert jwks.fetches == 2
+
+
+def test_unknown_kid_refresh_is_rate_limited():
+    jwks = LocalJWKSCache(FIRST_JWK)
+    _verify(jwks, _token(FIRST_KEY, "first"))
+    for _ in range(3):
+        with pytest.raises(jwt.InvalidTokenError):
+            _verify(jwks, _token(SECOND_KEY, "second"))
+    assert jwks.fetches == 1
+
+
+def test_never_fetched_is_stale_on_a_young_clock(monkeypatch):
+    # Right after boot the monotonic clock can be below the TTL
+    monkeypatch.setattr(time, "monotonic", lambda: 10.0)
+    assert LocalJWKSCache(FIRST_JWK).is_stale
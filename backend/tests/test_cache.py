@@ -0,0 +1,54 @@
+from types import SimpleNamespace
+
+import pytest
+import cache
+from cache import TTLCache
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = SimpleNamespace(value=1000.0)
+    monkeypatch.setattr(cache, "time", SimpleNamespace(monotonic=lambda: now.value))
+    return now
+
+
+def test_entries_expire_after_the_ttl(clock):
+    entries = TTLCache(maxsize=10, ttl=60)
+    entries.set("a", 1)
+    clock.value += 59
+    assert entries.get("a") == 1
+    clock.value += 1
+    assert entries.get("a") is None
+
+
+def test_per_entry_ttl_is_capped_by_the_cache_ttl(clock):
+    entries = TTLCache(maxsize=10, ttl=60)
+    entries.set("short", 1, ttl=5)
+    entries.set("long", 2, ttl=600)
+    clock.value += 5
+    assert entries.get("short") is None
+    assert entries.get("long") == 2
+    clock.value += 55
+    assert entries.get("long") is None
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    entries = TTLCache(maxsize=2, ttl=60)
+    entries.set("a", 1)
+    entries.set("b", 2)
+    assert entries.get("a") == 1  # "b" is now the least recently used
+    entries.set("c", 3)
+    assert entries.get("b") is None
+    assert entries.get("a") == 1
+    assert entries.get("c") == 3
+
+
+def test_pop_and_clear(clock):
+    entries = TTLCache(maxsize=10, ttl=60)
+    entries.set("a", 1)
+    entries.set("b", 2)
+    entries.pop("a")
+    entries.pop("missing")
+    assert entries.get("a") is None
+    entries.clear()
+    assert entries.get("b") is None
@@ -0,0 +1,68 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from fastapi.testclient import TestClient
+from ingest import IngestPool, IngestPoolFullError, ingest_pool
+
+
+def test_slots_are_bounded():
+    async def scenario():
+        pool = IngestPool(workers=1, max_pending=1)
+        async with pool.slot(), pool.slot():
+            assert pool.active == 2
+            with pytest.raises(IngestPoolFullError):
+                async with pool.slot():
+                    pass
+        assert pool.active == 0
+        async with pool.slot():
+            assert pool.active == 1
+
+    asyncio.run(scenario())
+
+
+def test_waiting_upload_gets_the_released_slot():
+    async def scenario():
+        pool = IngestPool(workers=0, max_pending=0)
+        order = []
+
+        async def upload(name: str, wait: bool):
+            async with pool.slot(wait):
+                order.append(name)
+                await asyncio.sleep(0.01)
+
+        first = asyncio.create_task(upload("first", wait=False))
+        await asyncio.sleep(0)
+        await asyncio.gather(first, upload("waiting", wait=True))
+        assert order == ["first", "waiting"]
+        assert pool.active == 0
+
+    asyncio.run(scenario())
+
+
+def test_full_pool_answers_503_with_retry_after(monkeypatch):
+    import main
+    import utils
+    from database import get_async_db, get_db
+
+    async def get_user(db, user_id):
+        return SimpleNamespace(callsign="TEST0ING")
+
+    async def no_summary(db, spotter, sha256):
+        return None
+
+    monkeypatch.setattr(utils, "get_or_create_user_from_clerk", get_user)
+    monkeypatch.setattr(main, "get_upload_summary_async", no_summary)
+    monkeypatch.setattr(ingest_pool, "active", ingest_pool.capacity)
+    overrides = {
+        utils.verify_clerk_session: lambda: "test-user",
+        get_async_db: lambda: None,
+        get_db: lambda: None,
+    }
+    monkeypatch.setattr(main.app, "dependency_overrides", overrides)
+
+    response = TestClient(main.app).post(
+        "/read-file", files={"file": ("log.adi", b"<EOH><EOR>")}
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "5"
@@ -0,0 +1,82 @@
+from leaderboard.service import Leaderboard
+
+
+def _ranking(board: Leaderboard, offset: int = 0, limit: int = 100) -> list:
+    return [
+        (entry.rank, entry.callsign, entry.total_areas, entry.total_regions)
+        for entry in board.page(offset, limit)
+    ]
+
+
+def _board() -> Leaderboard:
+    board = Leaderboard()
+    board.rebuild(
+        [("4X1AA", 10, 3), ("4X1BB", 20, 5), ("4X1CC", 10, 3), ("4X1DD", 10, 4)]
+    )
+    return board
+
+
+def test_rebuild_sorts_and_ties_share_a_rank():
+    assert _ranking(_board()) == [
+        (1, "4X1BB", 20, 5),
+        (2, "4X1DD", 10, 4),
+        (3, "4X1AA", 10, 3),
+        (3, "4X1CC", 10, 3),
+    ]
+
+
+def test_rebuild_replaces_everything():
+    board = _board()
+    board.rebuild([("4X1EE", 1, 1)])
+    assert _ranking(board) == [(1, "4X1EE", 1, 1)]
+    assert len(board) == 1
+
+
+def test_update_inserts_a_new_spotter():
+    board = _board()
+    board.update("4X1EE", 15, 4)
+    assert [entry[1] for entry in _ranking(board)] == [
+        "4X1BB",
+        "4X1EE",
+        "4X1DD",
+        "4X1AA",
+        "4X1CC",
+    ]
+    assert len(board) == 5
+
+
+def test_update_moves_an_existing_spotter():
+    board = _board()
+    board.update("4X1CC", 25, 6)
+    assert _ranking(board)[0] == (1, "4X1CC", 25, 6)
+    assert [entry[1] for entry in _ranking(board)][1:] == ["4X1BB", "4X1DD", "4X1AA"]
+    assert len(board) == 4
+
+    # Unchanged totals are a no-op
+    board.update("4X1CC", 25, 6)
+    assert len(board) == 4
+
+
+def test_update_into_a_tie():
+    board = _board()
+    board.update("4X1DD", 10, 3)
+    assert _ranking(board)[1:] == [
+        (2, "4X1AA", 10, 3),
+        (2, "4X1CC", 10, 3),
+        (2, "4X1DD", 10, 3),
+    ]
+
+
+def test_page_bounds():
+    board = _board()
+    assert _ranking(board, 1, 2) == [(2, "4X1DD", 10, 4), (3, "4X1AA", 10, 3)]
+    assert _ranking(board, 3, 10) == [(3, "4X1CC", 10, 3)]
+    assert _ranking(board, 4, 10) == []
+    assert _ranking(board, 100, 10) == []
+    assert Leaderboard().page(0, 10) == []
+
+
+def test_tie_rank_is_the_same_on_every_page():
+    board = Leaderboard()
+    board.rebuild([(f"4X{i}AA", 5, 2) for i in range(5)])
+    assert {entry[0] for entry in _ranking(board, 3, 2)} == {1}
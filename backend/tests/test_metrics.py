@@ -0,0 +1,59 @@
+from metrics import Counter, Gauge, Histogram, Registry
+
+
+def test_counter():
+    registry = Registry()
+    counter = Counter("test_total", "Things counted.", registry=registry)
+    counter.inc()
+    counter.inc(2)
+    assert registry.render() == (
+        "# HELP test_total Things counted.\n"
+        "# TYPE test_total counter\n"
+        "test_total 3.0\n"
+    )
+
+
+def test_labelled_counter():
+    registry = Registry()
+    counter = Counter("test_total", "Things counted.", ("kind",), registry=registry)
+    counter.labels("a").inc()
+    counter.labels("b").inc(5)
+    counter.labels("a").inc()
+    assert registry.render().splitlines()[2:] == [
+        'test_total{kind="a"} 2.0',
+        'test_total{kind="b"} 5.0',
+    ]
+
+
+def test_histogram_buckets():
+    registry = Registry()
+    histogram = Histogram(
+        "test_seconds", "Time.", ("stage",), buckets=(0.1, 1), registry=registry
+    )
+    for value in (0.05, 0.1, 0.5, 3):
+        histogram.labels("parse").observe(value)
+    assert registry.render() == (
+        "# HELP test_seconds Time.\n"
+        "# TYPE test_seconds histogram\n"
+        'test_seconds_bucket{stage="parse",le="0.1"} 2\n'
+        'test_seconds_bucket{stage="parse",le="1"} 3\n'
+        'test_seconds_bucket{stage="parse",le="+Inf"} 4\n'
+        'test_seconds_sum{stage="parse"} 3.65\n'
+        'test_seconds_count{stage="parse"} 4\n'
+    )
+
+
+def test_unlabelled_histogram_and_gauge():
+    registry = Registry()
+    histogram = Histogram("test_seconds", "Time.", buckets=(1,), registry=registry)
+    histogram.observe(2)
+    Gauge("test_open", "Open things.", ("pool",), lambda: {("sync",): 3}, registry)
+    assert registry.render().splitlines()[2:] == [
+        'test_seconds_bucket{le="1"} 0',
+        'test_seconds_bucket{le="+Inf"} 1',
+        "test_seconds_sum 2.0",
+        "test_seconds_count 1",
+        "# HELP test_open Open things.",
+        "# TYPE test_open gauge",
+        'test_open{pool="sync"} 3',
+    ]
@@ -0,0 +1,79 @@
+from datetime import datetime, timezone
+from area_grids import AREAS
+from progress import (
+    AREA_CODES,
+    BITSET_BYTES,
+    areas_to_bits,
+    bits_to_areas,
+    bits_to_bytes,
+    bytes_to_bits,
+    new_areas,
+    worked_regions,
+)
+from qsos.schema import QSOResponse
+from qsos.service import summarize_new_qsos
+
+KT_AREAS = AREAS["KT"][:2]
+YZ_AREA = AREAS["YZ"][0]
+
+
+def test_areas_round_trip_in_index_order():
+    areas = [YZ_AREA, *KT_AREAS]
+    assert bits_to_areas(areas_to_bits(areas)) == sorted(areas, key=AREA_CODES.index)
+
+
+def test_unknown_and_duplicate_areas():
+    assert areas_to_bits(["Z99ZZ", ""]) == 0
+    assert areas_to_bits(KT_AREAS + KT_AREAS) == areas_to_bits(KT_AREAS)
+    assert bits_to_areas(0) == []
+
+
+def test_every_area_has_its_own_bit():
+    assert areas_to_bits(AREA_CODES) == (1 << len(AREA_CODES)) - 1
+    assert bits_to_areas(areas_to_bits(AREA_CODES)) == list(AREA_CODES)
+
+
+def test_worked_regions():
+    assert worked_regions(0) == []
+    assert worked_regions(areas_to_bits(KT_AREAS)) == ["KT"]
+    assert set(worked_regions(areas_to_bits([*KT_AREAS, YZ_AREA]))) == {"KT", "YZ"}
+
+
+def test_new_areas():
+    before = areas_to_bits(KT_AREAS[:1])
+    after = areas_to_bits([*KT_AREAS, YZ_AREA])
+    assert new_areas(before, after) == bits_to_areas(after & ~before)
+    assert set(new_areas(before, after)) == {KT_AREAS[1], YZ_AREA}
+    assert new_areas(after, after) == []
+
+
+def test_bytes_round_trip():
+    bits = areas_to_bits([AREA_CODES[0], AREA_CODES[-1]])
+    data = bits_to_bytes(bits)
+    assert len(data) == BITSET_BYTES
+    assert bytes_to_bits(data) == bits
+    assert bytes_to_bits(b"") == bytes_to_bits(None) == 0
+
+
+def _qso(i: int, area: str) -> QSOResponse:
+    return QSOResponse(
+        id=i,
+        date="20250101",
+        freq=14.0,
+        spotter="TEST0SUM",
+        dx="4X1AA",
+        area=area,
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_summarize_new_qsos():
+    known = areas_to_bits(KT_AREAS[:1])
+    new_qsos = [_qso(1, KT_AREAS[1]), _qso(2, YZ_AREA)]
+    summary = summarize_new_qsos("TEST0SUM", new_qsos, known)
+    assert summary == {
+        "total_qsos": 2,
+        "callsign": "TEST0SUM",
+        "new_areas": bits_to_areas(areas_to_bits([KT_AREAS[1], YZ_AREA])),
+        "new_regions": ["YZ"],
+    }
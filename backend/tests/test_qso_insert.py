@@ -0,0 +1,79 @@
+from adif_service import AdifService
+from adif_tokenizer import tokenize_adif
+from metrics import INGEST_STAGE_SECONDS
+from qsos import repository
+from qsos.repository import insert_qso_columns
+
+# Synthetic callsign, never a real station
+SPOTTER = "TEST0INS"
+
+
+def _adif(*records: str) -> bytes:
+    return ("<EOH>\n" + "".join(f"{r} <EOR>\n" for r in records)).encode()
+
+
+def _record(fields: dict) -> str:
+    return " ".join(f"<{name}:{len(value)}>{value}" for name, value in fields.items())
+
+
+RECORDS = _adif(
+    # Complete record
+    _record(
+        {
+            "STATION_CALLSIGN": SPOTTER,
+            "CALL": "4X1AA",
+            "QSO_DATE": "20250804",
+            "TIME_ON": "1230",
+            "FREQ": "14.2",
+            "SRX_STRING": "N05KT",
+        }
+    ),
+    # No TIME_ON
+    _record(
+        {
+            "STATION_CALLSIGN": SPOTTER,
+            "CALL": "4X1BB",
+            "QSO_DATE": "20250805",
+            "FREQ": "7.1",
+            "SRX_STRING": "K07YZ",
+        }
+    ),
+    # Neither QSO_DATE nor TIME_ON valid
+    _record(
+        {
+            "STATION_CALLSIGN": SPOTTER,
+            "CALL": "4X1CC",
+            "QSO_DATE": "20250231",
+            "TIME_ON": "9999",
+            "FREQ": "21.0",
+            "SRX_STRING": "E16AS",
+        }
+    ),
+)
+
+
+def test_columns_parse_missing_and_invalid_times():
+    columns = AdifService(tokenize_adif(RECORDS), SPOTTER).get_valid_columns()
+    assert columns.qso_date == ["2025-08-04", "2025-08-05", None]
+    assert columns.qso_at == ["2025-08-04T12:30:00+00:00", None, None]
+
+
+def test_insert_records_without_time_on(sync_db, spotter):
+    columns = AdifService(tokenize_adif(RECORDS), spotter).get_valid_columns()
+    inserted = {qso.dx: qso for qso in insert_qso_columns(sync_db, columns)}
+
+    assert inserted["4X1AA"].qso_at is not None
+    assert inserted["4X1BB"].qso_date.isoformat() == "2025-08-05"
+    assert inserted["4X1BB"].qso_at is None
+    assert inserted["4X1CC"].qso_date is None
+    assert inserted["4X1CC"].qso_at is None
+
+
+def test_insert_time_is_observed_once_per_upload(sync_db, spotter, monkeypatch):
+    monkeypatch.setattr(repository, "COPY_CHUNK_SIZE", 1)
+    insert_seconds = INGEST_STAGE_SECONDS.labels("insert")
+    count_before = sum(insert_seconds.counts)
+
+    columns = AdifService(tokenize_adif(RECORDS), spotter).get_valid_columns()
+    assert len(insert_qso_columns(sync_db, columns)) == 3
+    assert sum(insert_seconds.counts) == count_before + 1
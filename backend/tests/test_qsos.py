@@ -0,0 +1,74 @@
+import base64
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from qsos.schema import QSOResponse
+from qsos.service import decode_cursor, encode_cursor
+
+
+def _qso(spotter: str, qso_id: int) -> QSOResponse:
+    return QSOResponse(
+        id=qso_id,
+        date="20250101",
+        freq=14.0,
+        spotter=spotter,
+        dx="4X1AA",
+        area="H03AK",
+        created_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+@pytest.mark.parametrize(
+    "spotter, qso_id", [("4X1AA", 1), ("4X/K1ABC", 2**31 - 1), ("", 0)]
+)
+def test_cursor_round_trip(spotter, qso_id):
+    cursor = encode_cursor(_qso(spotter, qso_id))
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (spotter, qso_id)
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+MALFORMED_CURSORS = [
+    "",
+    "garbage!",
+    "שלום",
+    _b64(b"not json"),
+    _b64(b'{"spotter": "4X1AA"}'),
+    _b64(b'["4X1AA"]'),
+    _b64(b'["4X1AA", 1, 2]'),
+    _b64(b'["4X1AA", "1"]'),
+    _b64(b"[1, 1]"),
+    _b64(b'["4X1AA", 1.5]'),
+]
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS)
+def test_malformed_cursor_raises(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    import main
+    import utils
+    from database import get_read_db
+
+    overrides = {
+        utils.verify_clerk_session: lambda: "test-user",
+        utils.is_admin: lambda: True,
+        get_read_db: lambda: None,
+    }
+    monkeypatch.setattr(main.app, "dependency_overrides", overrides)
+    return TestClient(main.app)
+
+
+@pytest.mark.parametrize("cursor", MALFORMED_CURSORS[1:])
+def test_malformed_cursor_answers_400(client, cursor):
+    response = client.get("/qsos", params={"cursor": cursor})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor"}
@@ -0,0 +1,71 @@
+from database import SessionLocal
+from progress import AREA_CODES, AREA_INDEX_VERSION, areas_to_bits, bits_to_bytes
+from qsos.models import QSOLogs, SpotterProgress
+from qsos.repository import get_known_area_bits, update_spotter_progress
+from qsos.schema import QSO
+
+# Synthetic callsign, never a real station
+SPOTTER = "TEST0PRG"
+
+
+def _qso(area: str) -> QSO:
+    return QSO(date="20250101", freq=14.0, spotter=SPOTTER, dx="4X1AA", area=area)
+
+
+def test_concurrent_update_is_not_lost(sync_db, spotter):
+    first, second = AREA_CODES[0], AREA_CODES[1]
+    update_spotter_progress(sync_db, [_qso(first)])
+    sync_db.commit()
+
+    # This session holds the progress row in its identity map
+    cached = sync_db.get(SpotterProgress, spotter)
+    assert get_known_area_bits(sync_db, spotter) == areas_to_bits([first])
+
+    # Another upload commits a new area meanwhile
+    other = SessionLocal()
+    try:
+        update_spotter_progress(other, [_qso(second)])
+        other.commit()
+    finally:
+        other.close()
+
+    third = AREA_CODES[2]
+    [(_, total_areas, _)] = update_spotter_progress(sync_db, [_qso(third)])
+    sync_db.commit()
+
+    assert total_areas == 3
+    assert cached.total_areas == 3
+    assert get_known_area_bits(sync_db, spotter) == areas_to_bits(
+        [first, second, third]
+    )
+
+
+def test_stale_area_index_version_is_rebuilt(sync_db, spotter):
+    first, second, third = AREA_CODES[:3]
+    for area in (first, second):
+        sync_db.add(QSOLogs(**_qso(area).model_dump()))
+    # Written with another bit order: the stored bits mean something else
+    sync_db.add(
+        SpotterProgress(
+            spotter=spotter,
+            area_bits=bits_to_bytes(areas_to_bits([AREA_CODES[-1]])),
+            total_areas=1,
+            total_regions=1,
+            area_index_version="old",
+        )
+    )
+    sync_db.commit()
+
+    assert get_known_area_bits(sync_db, spotter) == areas_to_bits([first, second])
+
+    sync_db.add(QSOLogs(**_qso(third).model_dump()))
+    sync_db.flush()
+    [(_, total_areas, _)] = update_spotter_progress(sync_db, [_qso(third)])
+    sync_db.commit()
+
+    assert total_areas == 3
+    progress = sync_db.get(SpotterProgress, spotter)
+    assert progress.area_index_version == AREA_INDEX_VERSION
+    assert get_known_area_bits(sync_db, spotter) == areas_to_bits(
+        [first, second, third]
+    )
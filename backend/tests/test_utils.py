@@ -0,0 +1,65 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import utils
+from utils import get_or_create_user_from_clerk, is_admin, pending_user_creations
+
+
+def test_is_admin(monkeypatch):
+    monkeypatch.setattr(utils, "ADMIN_TOKEN", "s3cret")
+    assert is_admin("s3cret")
+    assert not is_admin("")
+    assert not is_admin("s3cre")
+    assert not is_admin("ſ3cret")
+
+
+def test_is_admin_disabled_without_token(monkeypatch):
+    monkeypatch.setattr(utils, "ADMIN_TOKEN", "")
+    assert not is_admin("")
+    assert not is_admin("anything")
+
+
+@pytest.fixture
+def new_user(monkeypatch):
+    """No user in the database yet, and a slow Clerk-backed creation."""
+    import users.service
+
+    calls = []
+
+    async def no_user(db, clerk_user_id):
+        return None
+
+    async def create(clerk_user_id):
+        calls.append(clerk_user_id)
+        await asyncio.sleep(0.01)
+        return SimpleNamespace(clerk_user_id=clerk_user_id)
+
+    monkeypatch.setattr(users.service, "get_cached_user_by_clerk_id", no_user)
+    monkeypatch.setattr(utils, "create_user_from_clerk", create)
+    return calls
+
+
+def test_concurrent_first_requests_create_one_user(new_user):
+    async def scenario():
+        return await asyncio.gather(
+            *(get_or_create_user_from_clerk(None, "user_1") for _ in range(5))
+        )
+
+    users = asyncio.run(scenario())
+    assert new_user == ["user_1"]
+    assert all(user is users[0] for user in users)
+    assert pending_user_creations == {}
+
+
+def test_cancelled_request_does_not_cancel_the_creation(new_user):
+    async def scenario():
+        first = asyncio.create_task(get_or_create_user_from_clerk(None, "user_1"))
+        await asyncio.sleep(0)
+        second = asyncio.create_task(get_or_create_user_from_clerk(None, "user_1"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second
+
+    assert asyncio.run(scenario()).clerk_user_id == "user_1"
+    assert new_user == ["user_1"]